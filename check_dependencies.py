@@ -35,7 +35,8 @@ def check_required_packages():
     optional_packages = {
         'wand': 'Traitement d\'images avancé (optionnel)',
         'numba': 'Optimisation des performances (optionnel)',
-        'psutil': 'Monitoring système (optionnel)'
+        'psutil': 'Monitoring système (optionnel)',
+        'pikepdf': 'Fusion PDF rapide (optionnel)'
     }
     
     all_good = True
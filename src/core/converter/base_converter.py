@@ -3,9 +3,38 @@ Classe de base pour les convertisseurs
 """
 
 import os
+import atexit
+import shutil
 import logging
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+
+# Extensions d'images reconnues dans les archives
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp')
+
+# Résultat du sondage des dépendances, partagé par tous les convertisseurs
+_dependencies = None
+_dependencies_lock = threading.Lock()
+
+# Répertoire temporaire partagé par tout le processus
+_shared_temp_dir = None
+_shared_temp_lock = threading.Lock()
+
+
+def get_temp_dir() -> Path:
+    """Retourne le répertoire temporaire du processus (créé au premier appel, supprimé à la sortie)"""
+    global _shared_temp_dir
+    with _shared_temp_lock:
+        if _shared_temp_dir is None:
+            # Sous-dossier unique dans le dossier temp du projet
+            base_temp = Path(__file__).parent.parent.parent.parent / "temp"
+            base_temp.mkdir(exist_ok=True)
+            _shared_temp_dir = Path(tempfile.mkdtemp(prefix="epub2pdf_", dir=base_temp))
+            atexit.register(shutil.rmtree, _shared_temp_dir, ignore_errors=True)
+        return _shared_temp_dir
 
 
 class BaseConverter:
@@ -15,61 +44,84 @@ class BaseConverter:
         self.max_workers = max_workers
         self.logger = logger or logging.getLogger('epub2pdf')
         
-        # Créer le répertoire temporaire relatif à l'exécutable
+        # Répertoire temporaire partagé relatif à l'exécutable
         self.base_dir = Path(__file__).parent.parent.parent.parent
-        self.temp_dir = self.base_dir / "temp"
-        self.temp_dir.mkdir(exist_ok=True)
+        self.temp_dir = get_temp_dir()
         
         # Vérifier les dépendances
         self._check_dependencies()
     
     def _check_dependencies(self):
-        """Vérifie les dépendances disponibles"""
+        """Vérifie les dépendances disponibles (sondage effectué une seule fois par processus)"""
+        global _dependencies
+        with _dependencies_lock:
+            if _dependencies is None:
+                _dependencies = self._probe_dependencies()
+        
+        self.pillow_available = _dependencies['pillow']
+        self.wand_available = _dependencies['wand']
+        self.pypdf2_available = _dependencies['pypdf2']
+        self.unar_available = _dependencies['unar']
+        self.unar_path = _dependencies['unar_path']
+    
+    def _probe_dependencies(self) -> Dict[str, Any]:
+        """Sonde les bibliothèques et outils externes"""
+        dependencies = {}
+        
         # Pillow
         try:
             from PIL import Image
-            self.pillow_available = True
+            dependencies['pillow'] = True
             self.logger.debug("✅ Pillow disponible")
         except ImportError:
-            self.pillow_available = False
+            dependencies['pillow'] = False
             self.logger.warning("⚠️ Pillow non installé. Installation recommandée: pip install Pillow")
         
         # Wand
         try:
             from wand.image import Image as WandImage
-            self.wand_available = True
+            dependencies['wand'] = True
             self.logger.debug("✅ Wand disponible")
         except ImportError as e:
-            self.wand_available = False
+            dependencies['wand'] = False
             self.logger.warning(f"⚠️ Wand non installé ou erreur d'import: {e}")
             self.logger.warning("Installation recommandée: pip install Wand")
         except Exception as e:
-            self.wand_available = False
+            dependencies['wand'] = False
             self.logger.warning(f"⚠️ Erreur lors de l'import de Wand: {e}")
         
         # PyPDF2
         try:
             from PyPDF2 import PdfWriter, PdfReader
-            self.pypdf2_available = True
+            dependencies['pypdf2'] = True
             self.logger.debug("✅ PyPDF2 disponible")
         except ImportError:
-            self.pypdf2_available = False
+            dependencies['pypdf2'] = False
             self.logger.warning("⚠️ PyPDF2 non installé. Installation recommandée: pip install PyPDF2")
         
-        # Vérifier unrar
-        try:
-            import subprocess
-            result = subprocess.run(['unar', '--version'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                self.logger.info("✅ unar disponible pour l'extraction")
-            else:
-                self.logger.warning("⚠️ unar non disponible - extraction limitée")
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            self.logger.warning("⚠️ unar non installé ou timeout - extraction limitée")
+        # Vérifier unrar (chemin absolu résolu une fois, sans parcours du PATH à chaque appel)
+        dependencies['unar'] = False
+        dependencies['unar_path'] = shutil.which('unar')
+        if dependencies['unar_path'] is None:
+            self.logger.warning("⚠️ unar non installé - extraction limitée")
+        else:
+            try:
+                import subprocess
+                result = subprocess.run([dependencies['unar_path'], '--version'], stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL, timeout=5)
+                if result.returncode == 0:
+                    dependencies['unar'] = True
+                    self.logger.info("✅ unar disponible pour l'extraction")
+                else:
+                    self.logger.warning("⚠️ unar non disponible - extraction limitée")
+            except (OSError, subprocess.TimeoutExpired):
+                self.logger.warning("⚠️ unar non installé ou timeout - extraction limitée")
         
         # Configurer le multiprocessing pour éviter les problèmes
         import multiprocessing
         multiprocessing.set_start_method('spawn', force=True)
+        
+        return dependencies
     
     def _natural_sort_key(self, path: str) -> list:
         """Clé de tri naturel pour les noms de fichiers"""
@@ -79,5 +131,4 @@ class BaseConverter:
     
     def _is_image_file(self, filename: str) -> bool:
         """Vérifie si un fichier est une image"""
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
-        return Path(filename).suffix.lower() in image_extensions
+        return filename.lower().endswith(IMAGE_EXTENSIONS)
@@ -13,22 +13,65 @@ from typing import List, Optional
 from .base_converter import BaseConverter
 
 
+# Signatures des archives ZIP (fichier local, archive vide)
+ZIP_SIGNATURES = (b'PK\x03\x04', b'PK\x05\x06')
+
+
 class Extractor(BaseConverter):
     """Extracteur pour les fichiers CBR/CBZ"""
     
+    def __init__(self, max_workers: int = 5, logger=None):
+        super().__init__(max_workers, logger)
+        # Cache des listes d'images par (chemin, date de modification, taille)
+        self._listing_cache = {}
+        self._max_listing_cache_size = 256
+    
+    def list_cbz_images(self, cbz_path: str) -> List[str]:
+        """Liste les images d'un CBZ en ne lisant le répertoire central qu'une fois"""
+        stat = os.stat(cbz_path)
+        cache_key = (str(cbz_path), stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._listing_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        with zipfile.ZipFile(cbz_path, 'r') as zip_ref:
+            image_files = [f for f in zip_ref.namelist() if self._is_image_file(f)]
+        
+        if len(self._listing_cache) >= self._max_listing_cache_size:
+            # Supprimer l'élément le plus ancien
+            oldest_key = next(iter(self._listing_cache))
+            self._listing_cache.pop(oldest_key, None)
+        
+        self._listing_cache[cache_key] = image_files
+        return image_files
+    
+    def is_zip_archive(self, archive_path: str) -> bool:
+        """Détecte une archive ZIP par sa signature (certains CBR sont des ZIP renommés)"""
+        try:
+            with open(archive_path, 'rb') as f:
+                return f.read(4).startswith(ZIP_SIGNATURES)
+        except OSError:
+            return False
+    
     def extract_cbr(self, cbr_path: str) -> List[str]:
         """Extrait un fichier CBR et retourne la liste des images"""
         try:
             self.logger.info(f"📦 Extraction du fichier CBR...")
             
+            # CBR au format ZIP: éviter unar et rarfile
+            if self.is_zip_archive(cbr_path):
+                self.logger.debug("📦 CBR au format ZIP détecté")
+                return self.extract_cbz(cbr_path)
+            
             # Créer un répertoire temporaire unique
             import uuid
             extract_dir = self.temp_dir / f"cbr2pdf_{uuid.uuid4().hex[:8]}"
             extract_dir.mkdir(exist_ok=True)
             self.logger.debug(f"📁 Répertoire temporaire: {extract_dir}")
             
-            # Essayer d'abord avec unrar (plus rapide)
-            if self._extract_with_unrar(cbr_path, str(extract_dir)):
+            # Essayer d'abord avec unrar (plus rapide), seulement s'il est installé
+            if self.unar_available and self._extract_with_unrar(cbr_path, str(extract_dir)):
                 return self._get_image_files(extract_dir)
             
             # Fallback avec rarfile
@@ -57,15 +100,12 @@ class Extractor(BaseConverter):
             file_size = os.path.getsize(cbz_path)
             self.logger.debug(f"📏 Taille du fichier CBZ: {file_size / (1024*1024):.1f} MB")
             
+            # Liste des images (partagée avec le comptage de pages)
+            image_files = self.list_cbz_images(cbz_path)
+            self.logger.info(f"📄 {len(image_files)} images trouvées dans le ZIP")
+            
             # Extraction ZIP
             with zipfile.ZipFile(cbz_path, 'r') as zip_ref:
-                # Lister tous les fichiers
-                all_files = zip_ref.namelist()
-                self.logger.debug(f"📋 {len(all_files)} fichiers dans le ZIP")
-                
-                # Filtrer les images
-                image_files = [f for f in all_files if self._is_image_file(f)]
-                self.logger.info(f"📄 {len(image_files)} images trouvées dans le ZIP")
                 
                 # Extraire les images
                 extracted_count = 0
@@ -105,15 +145,18 @@ class Extractor(BaseConverter):
         """Extrait avec unrar (plus rapide)"""
         try:
             result = subprocess.run(
-                ['unar', '-o', extract_dir, cbr_path],
-                capture_output=True,
+                [self.unar_path or 'unar', '-o', extract_dir, cbr_path],
+                # La sortie standard (liste des fichiers) n'est jamais lue
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=60  # Augmenter le timeout
             )
             if result.returncode == 0:
-                # Vérifier que des fichiers ont été extraits
-                extracted_files = list(Path(extract_dir).rglob('*'))
-                if len(extracted_files) > 0:
+                # Vérifier que des fichiers ont été extraits (une seule entrée suffit)
+                with os.scandir(extract_dir) as entries:
+                    has_entries = next(entries, None) is not None
+                if has_entries:
                     return True
                 else:
                     self.logger.warning("⚠️ unrar a réussi mais aucun fichier extrait")
@@ -171,9 +214,15 @@ class Extractor(BaseConverter):
         """Récupère la liste des images dans un répertoire"""
         try:
             image_files = []
-            for file_path in extract_dir.rglob('*'):
-                if file_path.is_file() and self._is_image_file(file_path.name):
-                    image_files.append(str(file_path))
+            pending = [str(extract_dir)]
+            # os.scandir: le type de chaque entrée est connu sans stat supplémentaire
+            while pending:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file() and self._is_image_file(entry.name):
+                            image_files.append(entry.path)
             
             # Dédupliquer et trier
             unique_paths = list(set(image_files))
@@ -10,6 +10,20 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from .base_converter import BaseConverter
 
 
+# Tailles cibles de redimensionnement
+TARGET_SIZES = {
+    "A4": (595, 842),      # A4: 210x297mm à 72dpi
+    "Letter": (612, 792),   # Letter: 8.5x11" à 72dpi
+    "A3": (842, 1191),     # A3: 297x420mm à 72dpi
+    "A5": (420, 595),      # A5: 148x210mm à 72dpi
+    "HD": (1280, 720),     # HD standard
+    "FHD": (1920, 1080),   # Full HD
+}
+
+# Modes que Pillow ne redimensionne qu'en NEAREST
+PALETTE_MODES = ('P', 'PA', '1', 'LA')
+
+
 class ImageProcessor(BaseConverter):
     """Processeur d'images optimisé pour la conversion PDF"""
     
@@ -174,8 +188,9 @@ class ImageProcessor(BaseConverter):
             if not valid_images:
                 return None
             
-            # Créer le PDF temporaire avec chemin relatif
-            temp_pdf = str(self.temp_dir / f"group_{group_num}.pdf")
+            # Créer le PDF temporaire (nom unique: plusieurs conversions en parallèle)
+            import uuid
+            temp_pdf = str(self.temp_dir / f"group_{uuid.uuid4().hex[:8]}_{group_num}.pdf")
             self.logger.debug(f"📄 Création PDF temporaire: {temp_pdf}")
             
             # Utiliser Pillow avec optimisations
@@ -233,12 +248,13 @@ class ImageProcessor(BaseConverter):
                 
                 self.logger.debug(f"📷 Chargement image {i+1}/{len(image_paths)}: {Path(img_path).name}")
                 
-                with self._open_image(img_path) as img:
+                with self._open_image(img_path) as source:
                     # Appliquer les options
-                    img = self._apply_image_options(img, options)
+                    img = self._apply_image_options(source, options)
                     
-                    # Copie pour éviter les problèmes
-                    img_copy = img.copy()
+                    # Copier seulement si l'image est encore liée au fichier source
+                    # (convert() renvoie déjà une nouvelle image)
+                    img_copy = source.copy() if img is source else img
                     images.append(img_copy)
                     
                     # Mettre en cache si possible
@@ -336,18 +352,29 @@ class ImageProcessor(BaseConverter):
     
     def _apply_image_options(self, img, options: Dict):
         """Applique les options de traitement à une image avec optimisations"""
-        # Convertir en RGB si nécessaire
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
+        grayscale = options.get('grayscale', False)
+        resize = options.get('resize')
         
-        # Appliquer les options
-        if options.get('grayscale', False):
-            img = img.convert('L').convert('RGB')
+        target_size = TARGET_SIZES.get(resize) if resize else None
         
-        resize = options.get('resize')
-        if resize:
+        # Pillow redimensionne les images palette/bitmap en NEAREST : les
+        # convertir avant pour garder le filtrage LANCZOS
+        if target_size and img.mode in PALETTE_MODES:
+            img = img.convert('L' if grayscale else 'RGB')
+        
+        # Redimensionner d'abord pour convertir moins de pixels ; sur un JPEG
+        # pas encore chargé, thumbnail() décode directement à 2x la cible
+        if target_size:
             img = self._resize_image(img, resize)
         
+        # Appliquer les options
+        if grayscale:
+            img = img.convert('L')
+        
+        # Convertir en RGB si nécessaire
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        
         return img
     
     def _resize_image(self, img, resize: str):
@@ -355,17 +382,7 @@ class ImageProcessor(BaseConverter):
         try:
             from PIL import Image
             
-            # Définir les tailles cibles optimisées
-            target_sizes = {
-                "A4": (595, 842),      # A4: 210x297mm à 72dpi
-                "Letter": (612, 792),   # Letter: 8.5x11" à 72dpi
-                "A3": (842, 1191),     # A3: 297x420mm à 72dpi
-                "A5": (420, 595),      # A5: 148x210mm à 72dpi
-                "HD": (1280, 720),     # HD standard
-                "FHD": (1920, 1080),   # Full HD
-            }
-            
-            target_size = target_sizes.get(resize)
+            target_size = TARGET_SIZES.get(resize)
             if not target_size:
                 return img
             
@@ -5,25 +5,72 @@ Gestionnaire de fichiers optimisé avec traitement parallèle et logs
 import os
 import logging
 import threading
-import subprocess
 import time
+import json
+import queue
+import re
+from collections import OrderedDict
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
 # Import du nouveau convertisseur Python natif
 from .converter import NativeConverter
 
+# Les scripts shell ont été remplacés par le convertisseur Python natif
+HAS_NATIVE_CONVERTER = True
+
+# Regroupement des notifications de conversion (fichiers / secondes)
+# L'intervalle n'est vérifié qu'à la fin d'un fichier: un fichier lent retarde
+# l'envoi du lot partiel jusqu'à la conversion suivante
+CALLBACK_BATCH_SIZE = 16
+CALLBACK_BATCH_INTERVAL = 0.05
+
+# Mémoire estimée par worker de conversion (octets)
+COMIC_WORKER_MEMORY = 512 * 1024 * 1024
+EPUB_WORKER_MEMORY = 128 * 1024 * 1024
+
+# Nombre maximal d'informations de fichiers gardées en cache (LRU)
+FILE_INFO_CACHE_SIZE = 256
+
+# Nombre maximal d'archives dont le nombre de pages est conservé sur disque
+PAGE_CACHE_SIZE = 5000
+
+# Extensions reconnues
+SUPPORTED_EXTENSIONS = frozenset({'.epub', '.cbr', '.cbz'})
+ARCHIVE_EXTENSIONS = frozenset({'.cbr', '.cbz'})
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'})
+
+# Patterns courants pour les mangas/comics, fusionnés en une seule regex
+# (les alternatives sont essayées dans l'ordre, le suffixe du groupe indique laquelle a réussi)
+METADATA_PATTERN = re.compile(
+    r'^(?:'
+    # Series - Volume 01 - Chapter 001
+    r'(?P<series1>.+?)\s*[-_]\s*[Vv]olume\s*(?P<volume1>\d+)\s*[-_]\s*[Cc]hapter\s*(?P<chapter1>\d+)'
+    # Series Vol.01 Ch.001
+    r'|(?P<series2>.+?)\s+[Vv]ol\.?\s*(?P<volume2>\d+)\s+[Cc]h\.?\s*(?P<chapter2>\d+)'
+    # Series 01-001
+    r'|(?P<series3>.+?)\s+(?P<volume3>\d+)-(?P<chapter3>\d+)'
+    r')'
+)
+# Découpage des nombres pour le tri naturel
+DIGITS_SPLIT_PATTERN = re.compile(r'(\d+)')
+
 
 class FileManager:
     """Gestionnaire de fichiers optimisé avec conversion Python natif"""
     
-    def __init__(self, scripts_dir=None):
-        """Initialise le gestionnaire de fichiers optimisé"""
+    def __init__(self, scripts_dir=None, page_cache_file=None):
+        """Initialise le gestionnaire de fichiers optimisé
+        
+        page_cache_file: fichier JSON où conserver le nombre de pages des archives
+        d'une session à l'autre (désactivé si None)
+        """
         self.files = []
         self.is_converting = False
         self.max_workers = 5
+        self._requested_workers = self.max_workers
         self.mal_client_id = None
         self.interface = None
         
@@ -36,6 +83,11 @@ class FileManager:
         self._file_cache = {}  # Cache pour les informations de fichiers
         self._max_cache_size = 100  # Taille maximale du cache
         self._scan_cache = {}  # Cache pour les scans de répertoires
+        self._info_cache = OrderedDict()  # Infos fichiers par (chemin, mtime, taille)
+        self._info_cache_lock = threading.Lock()
+        self._page_cache_file = Path(page_cache_file) if page_cache_file else None
+        self._page_cache_lock = threading.Lock()
+        self._page_cache_dirty = False
         self._conversion_stats = {
             'total_files': 0,
             'converted_files': 0,
@@ -43,19 +95,18 @@ class FileManager:
             'start_time': None,
             'end_time': None
         }
+        self._converted_count = 0
+        self._failed_count = 0
+        self._stats_lock = threading.Lock()
         
         # Configurer le logging en premier
         self._setup_logging()
         
+        # Nombres de pages persistés: chemin -> [mtime_ns, taille, pages]
+        self._page_cache = self._load_page_cache()
+        
         # Initialiser le convertisseur natif après le logger
         self.native_converter = NativeConverter(max_workers=self.max_workers, logger=self.logger)
-        
-        self._check_scripts()
-    
-    def _check_scripts(self):
-        """Vérifie la présence des scripts shell (fallback) - DÉPRÉCIÉ"""
-        # Les scripts shell ont été remplacés par le convertisseur Python natif
-        self.logger.info("✅ Convertisseur Python natif disponible")
     
     def _setup_logging(self):
         """Configure le système de logging optimisé"""
@@ -89,6 +140,7 @@ class FileManager:
                 self.logger.addHandler(console_handler)
             
             self.logger.info(f"Dossier de logs: {logs_dir}")
+            self.logger.debug("✅ Convertisseur Python natif disponible")
             
         except Exception as e:
             self.logger.error(f"Erreur configuration logging: {e}")
@@ -104,6 +156,8 @@ class FileManager:
     def set_max_workers(self, workers):
         """Configure le nombre maximum de workers avec optimisations"""
         try:
+            self._requested_workers = workers
+            workers = self._cap_workers(workers, COMIC_WORKER_MEMORY)
             self.max_workers = workers
             self.native_converter.max_workers = workers
             self.logger.info(f"Nombre de workers configuré: {workers}")
@@ -114,6 +168,21 @@ class FileManager:
         except Exception as e:
             self.logger.error(f"Erreur configuration workers: {e}")
     
+    def _cap_workers(self, workers: int, worker_memory: int) -> int:
+        """Borne le nombre de workers selon la mémoire disponible et les CPU"""
+        cpu_cap = os.cpu_count() or 4
+        try:
+            import psutil
+            mem_cap = max(1, psutil.virtual_memory().available // worker_memory)
+        except ImportError:
+            mem_cap = workers
+        
+        capped = max(1, min(workers, mem_cap, cpu_cap))
+        if capped != workers:
+            self.logger.info(f"⚙️ Workers limités à {capped} (demandés: {workers}, "
+                             f"mémoire: {mem_cap}, CPU: {cpu_cap})")
+        return capped
+    
     def scan_directory(self, directory_path, recursive=False):
         """Scanne un répertoire avec optimisations de performance"""
         try:
@@ -145,6 +214,7 @@ class FileManager:
             
             # Mettre en cache
             self._scan_cache[cache_key] = file_infos
+            self.save_page_cache()
             
             elapsed_time = time.time() - start_time
             self.logger.info(f"✅ Scan terminé: {len(file_infos)} fichiers en {elapsed_time:.2f}s")
@@ -155,33 +225,54 @@ class FileManager:
             self.logger.error(f"❌ Erreur scan répertoire: {e}")
             return []
     
+    def iter_scan(self, directory_path, recursive=False):
+        """Scanne un répertoire en produisant les informations de fichiers au fil de l'eau"""
+        if not os.path.exists(directory_path):
+            self.logger.error(f"❌ Répertoire inexistant: {directory_path}")
+            return
+        
+        # Le parcours du disque alimente la file pendant que l'appelant consomme
+        paths = queue.Queue()
+        
+        def walk():
+            try:
+                if recursive:
+                    for root, dirs, filenames in os.walk(directory_path):
+                        for filename in filenames:
+                            if self._is_supported_file(filename):
+                                paths.put(os.path.join(root, filename))
+                else:
+                    for file_path in self._scan_simple_optimized(directory_path):
+                        paths.put(file_path)
+            except Exception as e:
+                self.logger.error(f"❌ Erreur scan en flux: {e}")
+            finally:
+                paths.put(None)
+        
+        threading.Thread(target=walk, daemon=True).start()
+        
+        while True:
+            file_path = paths.get()
+            if file_path is None:
+                break
+            file_info = self._create_file_info(file_path)
+            if file_info:
+                yield file_info
+        
+        self.save_page_cache()
+    
     def _scan_recursive_optimized(self, directory_path: str) -> List[str]:
-        """Scan récursif optimisé avec parallélisme"""
+        """Scan récursif optimisé"""
         files = []
         
         try:
-            # Utiliser ThreadPoolExecutor pour scanner les sous-répertoires
-            with ThreadPoolExecutor(max_workers=min(4, self.max_workers)) as executor:
-                futures = []
-                
-                for root, dirs, filenames in os.walk(directory_path):
-                    # Filtrer les fichiers supportés directement
-                    supported_files = [
-                        os.path.join(root, filename) 
-                        for filename in filenames 
-                        if self._is_supported_file(filename)
-                    ]
-                    
-                    if supported_files:
-                        futures.append(executor.submit(self._process_directory_files, supported_files))
-                
-                # Collecter les résultats
-                for future in as_completed(futures):
-                    try:
-                        result = future.result()
-                        files.extend(result)
-                    except Exception as e:
-                        self.logger.warning(f"⚠️ Erreur traitement répertoire: {e}")
+            for root, dirs, filenames in os.walk(directory_path):
+                # Filtrer les fichiers supportés directement
+                files.extend(
+                    os.path.join(root, filename) 
+                    for filename in filenames 
+                    if self._is_supported_file(filename)
+                )
             
         except Exception as e:
             self.logger.error(f"❌ Erreur scan récursif: {e}")
@@ -201,10 +292,6 @@ class FileManager:
             self.logger.error(f"❌ Erreur scan simple: {e}")
             return []
     
-    def _process_directory_files(self, file_paths: List[str]) -> List[str]:
-        """Traite les fichiers d'un répertoire en parallèle"""
-        return file_paths  # Pour l'instant, retourne directement
-    
     def _process_files_parallel(self, file_paths: List[str]) -> List[Dict]:
         """Traite les informations de fichiers en parallèle"""
         file_infos = []
@@ -227,63 +314,92 @@ class FileManager:
         return file_infos
     
     def _is_supported_file(self, filename: str) -> bool:
-        """Vérifie si un fichier est supporté avec cache"""
-        # Vérifier le cache d'abord
-        if filename in self._file_cache:
-            return self._file_cache[filename].get('supported', False)
-        
-        # Extensions supportées
-        supported_extensions = {'.epub', '.cbr', '.cbz'}
-        file_ext = Path(filename).suffix.lower()
-        is_supported = file_ext in supported_extensions
-        
-        # Mettre en cache
-        self._add_to_file_cache(filename, {'supported': is_supported})
-        
-        return is_supported
+        """Vérifie si un fichier est supporté"""
+        return os.path.splitext(filename)[1].lower() in SUPPORTED_EXTENSIONS
     
-    def _add_to_file_cache(self, filename: str, info: Dict):
+    def _add_to_file_cache(self, key, info: Dict):
         """Ajoute des informations au cache de fichiers"""
         if len(self._file_cache) >= self._max_cache_size:
-            # Supprimer l'élément le plus ancien
-            oldest_key = next(iter(self._file_cache))
-            del self._file_cache[oldest_key]
+            # Supprimer l'élément le plus ancien (tolère une suppression concurrente)
+            oldest_key = next(iter(self._file_cache), None)
+            self._file_cache.pop(oldest_key, None)
         
-        self._file_cache[filename] = info
+        self._file_cache[key] = info
+    
+    def _load_page_cache(self) -> Dict[str, list]:
+        """Charge les nombres de pages enregistrés lors des sessions précédentes"""
+        if self._page_cache_file is None or not self._page_cache_file.exists():
+            return {}
+        try:
+            data = json.loads(self._page_cache_file.read_text(encoding='utf-8'))
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ Cache des pages illisible {self._page_cache_file}: {e}")
+            return {}
+    
+    def _remember_page_count(self, file_path: str, stat: os.stat_result, page_count: int):
+        """Enregistre le nombre de pages d'une archive pour les sessions suivantes"""
+        if self._page_cache_file is None:
+            return
+        with self._page_cache_lock:
+            # Réinsérer en fin: les entrées les plus anciennes sont évincées d'abord
+            self._page_cache.pop(file_path, None)
+            self._page_cache[file_path] = [stat.st_mtime_ns, stat.st_size, page_count]
+            if len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.pop(next(iter(self._page_cache)))
+            self._page_cache_dirty = True
+    
+    def save_page_cache(self):
+        """Écrit le cache des nombres de pages s'il a changé"""
+        with self._page_cache_lock:
+            if not self._page_cache_dirty:
+                return
+            self._page_cache_dirty = False
+            data = json.dumps(self._page_cache)
+        try:
+            self._page_cache_file.write_text(data, encoding='utf-8')
+        except OSError as e:
+            self.logger.warning(f"⚠️ Erreur sauvegarde cache des pages: {e}")
     
     def _count_pages(self, file_path: str) -> int:
         """Compte les pages d'un fichier avec optimisations"""
         try:
-            # Vérifier le cache d'abord
-            if file_path in self._file_cache and 'page_count' in self._file_cache[file_path]:
-                return self._file_cache[file_path]['page_count']
-            
-            file_ext = Path(file_path).suffix.lower()
-            
-            if file_ext in ['.cbr', '.cbz']:
+            # Vérifier le cache d'abord (clé invalidée si le fichier change)
+            stat = os.stat(file_path)
+            cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+            cached = self._file_cache.get(cache_key)
+            if cached is not None and 'page_count' in cached:
+                return cached['page_count']
+            
+            file_ext = os.path.splitext(file_path)[1].lower()
+            
+            if file_ext in ARCHIVE_EXTENSIONS:
+                # Nombre de pages connu d'une session précédente, fichier inchangé
+                persisted = self._page_cache.get(str(file_path))
+                if persisted is not None and persisted[:2] == [stat.st_mtime_ns, stat.st_size]:
+                    self._add_to_file_cache(cache_key, {'page_count': persisted[2]})
+                    return persisted[2]
+                
                 # Pour les archives, estimer le nombre de pages
                 try:
-                    import zipfile
                     import rarfile
                     
-                    if file_ext == '.cbz':
-                        with zipfile.ZipFile(file_path, 'r') as zip_file:
-                            # Compter les fichiers d'images
-                            image_files = [
-                                f for f in zip_file.namelist() 
-                                if self._is_image_file(f.lower())
-                            ]
-                            page_count = len(image_files)
-                    else:  # .cbr
+                    extractor = self.native_converter.extractor
+                    if file_ext == '.cbz' or extractor.is_zip_archive(file_path):
+                        # Liste mise en cache par l'extracteur pour la conversion
+                        image_files = extractor.list_cbz_images(file_path)
+                        page_count = len(image_files)
+                    else:  # .cbr (RAR)
                         with rarfile.RarFile(file_path, 'r') as rar_file:
-                            image_files = [
-                                f for f in rar_file.namelist() 
+                            # Compter sans construire de liste intermédiaire
+                            page_count = sum(
+                                1 for f in rar_file.namelist()
                                 if self._is_image_file(f.lower())
-                            ]
-                            page_count = len(image_files)
+                            )
                     
                     # Mettre en cache
-                    self._add_to_file_cache(file_path, {'page_count': page_count})
+                    self._add_to_file_cache(cache_key, {'page_count': page_count})
+                    self._remember_page_count(str(file_path), stat, page_count)
                     return page_count
                     
                 except Exception as e:
@@ -292,12 +408,11 @@ class FileManager:
             else:
                 # Pour les EPUB, estimation basée sur la taille
                 try:
-                    file_size = os.path.getsize(file_path)
                     # Estimation: 1 page par 50KB environ
-                    estimated_pages = max(1, file_size // (50 * 1024))
+                    estimated_pages = max(1, stat.st_size // (50 * 1024))
                     
                     # Mettre en cache
-                    self._add_to_file_cache(file_path, {'page_count': estimated_pages})
+                    self._add_to_file_cache(cache_key, {'page_count': estimated_pages})
                     return estimated_pages
                     
                 except Exception as e:
@@ -310,23 +425,27 @@ class FileManager:
     
     def _is_image_file(self, filename: str) -> bool:
         """Vérifie si un fichier est une image"""
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
-        return Path(filename).suffix.lower() in image_extensions
+        return os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS
     
     def _create_file_info(self, file_path):
         """Crée les informations d'un fichier avec optimisations"""
         try:
-            # Vérifier le cache d'abord
-            if file_path in self._file_cache and 'file_info' in self._file_cache[file_path]:
-                return self._file_cache[file_path]['file_info']
-            
-            if not os.path.exists(file_path):
+            # Obtenir les informations de base
+            try:
+                stat = os.stat(file_path)
+            except OSError:
                 return None
             
-            # Obtenir les informations de base
-            stat = os.stat(file_path)
-            filename = Path(file_path).name
-            file_ext = Path(file_path).suffix.lower()
+            # Vérifier le cache d'abord (invalidé si le fichier change)
+            cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+            with self._info_cache_lock:
+                cached = self._info_cache.get(cache_key)
+                if cached is not None:
+                    self._info_cache.move_to_end(cache_key)
+                    return dict(cached)
+            
+            filename = os.path.basename(file_path)
+            file_ext = os.path.splitext(filename)[1].lower()
             
             # Créer les informations du fichier
             file_info = {
@@ -360,7 +479,10 @@ class FileManager:
                 })
             
             # Mettre en cache
-            self._add_to_file_cache(file_path, {'file_info': file_info})
+            with self._info_cache_lock:
+                self._info_cache[cache_key] = dict(file_info)
+                if len(self._info_cache) > FILE_INFO_CACHE_SIZE:
+                    self._info_cache.popitem(last=False)
             
             return file_info
             
@@ -371,43 +493,31 @@ class FileManager:
     def _extract_metadata(self, filename: str) -> Tuple[str, str, str]:
         """Extrait les métadonnées d'un nom de fichier"""
         # Supprimer l'extension
-        name_without_ext = Path(filename).stem
+        name_without_ext = os.path.splitext(filename)[0]
         
-        # Patterns courants pour les mangas/comics
-        import re
-        
-        # Pattern: Series - Volume 01 - Chapter 001
-        pattern1 = r'^(.+?)\s*[-_]\s*[Vv]olume\s*(\d+)\s*[-_]\s*[Cc]hapter\s*(\d+)'
-        match = re.search(pattern1, name_without_ext)
-        if match:
-            return match.group(1).strip(), f"Volume {match.group(2)}", f"Chapter {match.group(3)}"
+        # Préfiltre: chaque pattern exige un tiret ou « vol », inutile de lancer la regex sinon
+        if '-' not in name_without_ext and 'vol' not in name_without_ext.lower():
+            return name_without_ext, '', ''
         
-        # Pattern: Series Vol.01 Ch.001
-        pattern2 = r'^(.+?)\s+[Vv]ol\.?\s*(\d+)\s+[Cc]h\.?\s*(\d+)'
-        match = re.search(pattern2, name_without_ext)
+        match = METADATA_PATTERN.match(name_without_ext)
         if match:
-            return match.group(1).strip(), f"Vol.{match.group(2)}", f"Ch.{match.group(3)}"
-        
-        # Pattern: Series 01-001
-        pattern3 = r'^(.+?)\s+(\d+)-(\d+)'
-        match = re.search(pattern3, name_without_ext)
-        if match:
-            return match.group(1).strip(), f"Vol.{match.group(2)}", f"Ch.{match.group(3)}"
+            # Le dernier groupe capturé (chapterN) identifie l'alternative
+            n = match.lastgroup[-1]
+            series = match.group(f'series{n}').strip()
+            volume, chapter = match.group(f'volume{n}'), match.group(f'chapter{n}')
+            if n == '1':
+                return series, f"Volume {volume}", f"Chapter {chapter}"
+            return series, f"Vol.{volume}", f"Ch.{chapter}"
         
         # Fallback: retourner le nom complet
         return name_without_ext, '', ''
     
     def _natural_sort_key(self, filename: str) -> List:
         """Clé de tri naturel optimisée"""
-        import re
-        
-        # Pattern pour extraire les nombres
-        pattern = r'(\d+)'
-        
         def convert(text):
             return int(text) if text.isdigit() else text.lower()
         
-        return [convert(c) for c in re.split(pattern, filename)]
+        return [convert(c) for c in DIGITS_SPLIT_PATTERN.split(filename)]
     
     def apply_filters(self, files, search_term="", series_filter="", volume_filter="", chapter_filter="", sort_by="name", reverse=False):
         """Applique les filtres avec optimisations"""
@@ -477,7 +587,7 @@ class FileManager:
         """Retourne les fichiers sélectionnés"""
         return [f for f in files if f.get('selected', False)]
     
-    def convert_files(self, files_to_convert, callback=None):
+    def convert_files(self, files_to_convert, callback=None, callback_batch=None):
         """Convertit les fichiers avec optimisations de performance"""
         try:
             if self.is_converting:
@@ -492,58 +602,133 @@ class FileManager:
                 'start_time': time.time(),
                 'end_time': None
             }
+            self._reset_counters()
+            
+            # Les EPUB sont plus légers: relever la limite mémoire
+            if files_to_convert and all(f.get('extension') == '.epub' for f in files_to_convert):
+                worker_memory = EPUB_WORKER_MEMORY
+            else:
+                worker_memory = COMIC_WORKER_MEMORY
+            self.max_workers = self._cap_workers(self._requested_workers, worker_memory)
+            self.native_converter.max_workers = self.max_workers
             
             self.logger.info(f"🚀 Début conversion de {len(files_to_convert)} fichiers")
             
             # Lancer la conversion en parallèle
-            self._run_parallel_conversion(files_to_convert, callback)
+            self._run_parallel_conversion(files_to_convert, callback, callback_batch)
             
         except Exception as e:
             self.logger.error(f"❌ Erreur conversion fichiers: {e}")
             self.is_converting = False
     
-    def _run_parallel_conversion(self, files_to_convert, callback=None):
+    def convert_stream(self, iter_files, callback=None, callback_batch=None):
+        """Convertit les fichiers au fur et à mesure qu'ils sont produits (ex: iter_scan)"""
+        try:
+            if self.is_converting:
+                self.logger.warning("⚠️ Conversion déjà en cours")
+                return
+            
+            self.is_converting = True
+            self._conversion_stats = {
+                'total_files': 0,
+                'converted_files': 0,
+                'failed_files': 0,
+                'start_time': time.time(),
+                'end_time': None
+            }
+            self._reset_counters()
+            
+            self.max_workers = self._cap_workers(self._requested_workers, COMIC_WORKER_MEMORY)
+            self.native_converter.max_workers = self.max_workers
+            
+            self.logger.info("🚀 Début conversion en flux")
+            
+            def counted(files):
+                for file_info in files:
+                    self._conversion_stats['total_files'] += 1
+                    yield file_info
+            
+            self._run_parallel_conversion(counted(iter_files), callback, callback_batch)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Erreur conversion en flux: {e}")
+            self.is_converting = False
+    
+    def _run_parallel_conversion(self, files_to_convert, callback=None, callback_batch=None):
         """Exécute la conversion en parallèle avec optimisations"""
+        # Fichiers terminés en attente de notification groupée
+        pending = []
+        last_flush = time.time()
+        
+        def notify(file_info):
+            nonlocal last_flush
+            if callback:
+                callback(file_info)
+            if callback_batch:
+                pending.append(file_info)
+                now = time.time()
+                if len(pending) >= CALLBACK_BATCH_SIZE or now - last_flush >= CALLBACK_BATCH_INTERVAL:
+                    batch = pending[:]
+                    pending.clear()
+                    last_flush = now
+                    callback_batch(batch)
+        
+        def handle(future, file_info):
+            try:
+                success = future.result()
+                
+                if success:
+                    file_info['converted'] = True
+                    file_info['status'] = 'completed'
+                    self._count_result(True)
+                    self.logger.info(f"✅ Conversion réussie: {file_info['name']}")
+                else:
+                    file_info['status'] = 'failed'
+                    self._count_result(False)
+                    self.logger.error(f"❌ Conversion échouée: {file_info['name']}")
+                    
+            except Exception as e:
+                file_info['status'] = 'failed'
+                file_info['error'] = str(e)
+                self._count_result(False)
+                self.logger.error(f"❌ Erreur conversion {file_info['name']}: {e}")
+            
+            # Appeler le callback si fourni: une erreur ne doit pas interrompre les autres résultats
+            try:
+                notify(file_info)
+            except Exception as e:
+                self.logger.error(f"❌ Erreur callback {file_info['name']}: {e}")
+        
         try:
             # Utiliser ThreadPoolExecutor pour la conversion parallèle
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Soumettre toutes les tâches de conversion
-                future_to_file = {
-                    executor.submit(self._convert_single_file, file_info): file_info 
-                    for file_info in files_to_convert
-                }
+                # Soumettre les tâches au fil de l'eau (liste ou générateur) en
+                # limitant le nombre de fichiers en vol
+                max_in_flight = self.max_workers * 2
+                future_to_file = {}
                 
-                # Traiter les résultats au fur et à mesure
-                for future in as_completed(future_to_file):
-                    file_info = future_to_file[future]
+                for file_info in files_to_convert:
+                    # Arrêt demandé: ne plus tirer de fichiers du scan
+                    if not self.is_converting:
+                        break
+                    future_to_file[executor.submit(self._convert_single_file, file_info)] = file_info
                     
-                    try:
-                        success = future.result()
-                        
-                        if success:
-                            file_info['converted'] = True
-                            file_info['status'] = 'completed'
-                            self._conversion_stats['converted_files'] += 1
-                            self.logger.info(f"✅ Conversion réussie: {file_info['name']}")
-                        else:
-                            file_info['status'] = 'failed'
-                            self._conversion_stats['failed_files'] += 1
-                            self.logger.error(f"❌ Conversion échouée: {file_info['name']}")
-                        
-                        # Appeler le callback si fourni
-                        if callback:
-                            callback(file_info)
-                            
-                    except Exception as e:
-                        file_info['status'] = 'failed'
-                        file_info['error'] = str(e)
-                        self._conversion_stats['failed_files'] += 1
-                        self.logger.error(f"❌ Erreur conversion {file_info['name']}: {e}")
-                        
-                        if callback:
-                            callback(file_info)
+                    if len(future_to_file) >= max_in_flight:
+                        done, _ = wait(future_to_file, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            handle(future, future_to_file.pop(future))
+                
+                # Traiter les résultats restants au fur et à mesure
+                for future in as_completed(future_to_file):
+                    handle(future, future_to_file[future])
+            
+            # Notifier les derniers fichiers en attente
+            if callback_batch and pending:
+                callback_batch(pending[:])
+                pending.clear()
             
             # Finaliser les statistiques
+            self._conversion_stats.update(self._counter_stats())
             self._conversion_stats['end_time'] = time.time()
             elapsed_time = self._conversion_stats['end_time'] - self._conversion_stats['start_time']
             
@@ -555,6 +740,28 @@ class FileManager:
         finally:
             self.is_converting = False
     
+    def _reset_counters(self):
+        """Remet à zéro les compteurs de conversion"""
+        with self._stats_lock:
+            self._converted_count = 0
+            self._failed_count = 0
+    
+    def _count_result(self, success: bool):
+        """Comptabilise le résultat d'une conversion"""
+        with self._stats_lock:
+            if success:
+                self._converted_count += 1
+            else:
+                self._failed_count += 1
+    
+    def _counter_stats(self) -> Dict:
+        """Lit les compteurs de conversion"""
+        with self._stats_lock:
+            return {
+                'converted_files': self._converted_count,
+                'failed_files': self._failed_count
+            }
+    
     def _convert_single_file(self, file_info):
         """Convertit un seul fichier avec optimisations"""
         try:
@@ -652,12 +859,17 @@ class FileManager:
     
     def get_conversion_stats(self) -> Dict:
         """Retourne les statistiques de conversion"""
-        return self._conversion_stats.copy()
+        stats = self._conversion_stats.copy()
+        if self.is_converting:
+            stats.update(self._counter_stats())
+        return stats
     
     def clear_caches(self):
         """Nettoie tous les caches"""
         self._file_cache.clear()
         self._scan_cache.clear()
+        with self._info_cache_lock:
+            self._info_cache.clear()
         self.logger.info("🧹 Caches nettoyés")
     
     def _finalize_merge(self):
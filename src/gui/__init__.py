@@ -2,8 +2,22 @@
 Package GUI pour l'interface utilisateur
 """
 
-from src.gui.modern_interface import ModernInterface
+import importlib
+
+# Import paresseux (PEP 562): PySide6 n'est chargé qu'au premier accès
+_LAZY_IMPORTS = {
+    'ModernInterface': 'src.gui.modern_interface',
+}
 
 __all__ = [
     'ModernInterface'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
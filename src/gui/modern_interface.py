@@ -4,9 +4,13 @@ Interface moderne avec PySide6 pour epub2pdf
 
 import sys
 import os
+import re
 import logging
+import threading
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List, Dict, Optional
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+from typing import Iterable, List, Dict, Optional
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -16,13 +20,44 @@ from PySide6.QtWidgets import (
     QFrame, QScrollArea, QGridLayout, QFormLayout, QInputDialog,
     QHeaderView, QDialog, QListWidget, QListWidgetItem
 )
-from PySide6.QtCore import Qt, QThread, Signal, QSize
+from PySide6.QtCore import Qt, QThread, Signal, QSize, QTimer
 from PySide6.QtGui import QFont, QPalette, QColor
 
 from src.core.file_manager import FileManager
+from src.core.converter import NativeConverter
+from src.core.converter.base_converter import get_temp_dir
 from src.utils.config_manager import ConfigManager
 
 
+# Premier nombre d'un nom de fichier (tri numérique)
+NUMBER_PATTERN = re.compile(r'\d+')
+# Nom de la série pour le fichier fusionné
+# Series - Volume XX - Chapter XXX
+MERGE_VOLUME_PATTERN = re.compile(r'^(.+?)\s*[-_]\s*[Vv]olume\s*\d+')
+# Series Vol.XX Ch.XXX
+MERGE_VOL_PATTERN = re.compile(r'^(.+?)\s+[Vv]ol\.?\s*\d+')
+# Unités d'affichage des tailles et facteurs d'échelle précalculés
+SIZE_UNITS = ("B", "KB", "MB")
+SIZE_SCALES = tuple(1.0 / (1 << (10 * i)) for i in range(len(SIZE_UNITS)))
+# Texte et couleur de la colonne statut de l'arbre des fichiers
+STATUS_DISPLAY = {
+    'pending': ('⏳ En attente', None),
+    'converting': ('🔄 Conversion...', QColor('#FFAA00')),  # Orange
+    'completed': ('✅ Terminé', QColor('#00AA00')),  # Vert
+    'failed': ('❌ Échoué', QColor('#FF0000')),  # Rouge
+    'merged': ('📄 Fusionné', QColor('#0088FF')),  # Bleu
+}
+
+
+def thread_converter(local: threading.local, file_manager: FileManager, max_workers: int) -> NativeConverter:
+    """Convertisseur propre au thread courant: ses caches ne sont pas partagés entre fichiers"""
+    converter = getattr(local, 'converter', None)
+    if converter is None:
+        converter = NativeConverter(max_workers=max_workers, logger=file_manager.logger)
+        local.converter = converter
+    return converter
+
+
 class CustomTreeWidget(QTreeWidget):
     """TreeWidget personnalisé pour gérer les clics sur les cases à cocher"""
     
@@ -56,6 +91,26 @@ class CustomTreeWidget(QTreeWidget):
         super().mousePressEvent(event)
 
 
+class ScanWorker(QThread):
+    """Worker thread pour le scan des fichiers en arrière-plan"""
+    scan_finished = Signal(list)  # files
+    scan_failed = Signal(str)  # message
+    
+    def __init__(self, file_manager: FileManager, directory: str, recursive: bool = False):
+        super().__init__()
+        self.file_manager = file_manager
+        self.directory = directory
+        self.recursive = recursive
+    
+    def run(self):
+        """Exécute le scan en arrière-plan"""
+        try:
+            files = self.file_manager.scan_directory(self.directory, recursive=self.recursive)
+            self.scan_finished.emit(files)
+        except Exception as e:
+            self.scan_failed.emit(str(e))
+
+
 class ConversionWorker(QThread):
     """Worker thread pour la conversion en arrière-plan"""
     progress_updated = Signal(int, int, str)  # current, total, message
@@ -68,6 +123,9 @@ class ConversionWorker(QThread):
         self.files_to_convert = files_to_convert
         self.output_directory = output_directory
         self.is_running = True
+        self._futures = []
+        self._local = threading.local()
+        self._inner_workers = 1
         
     def run(self):
         """Exécute la conversion en arrière-plan"""
@@ -78,36 +136,50 @@ class ConversionWorker(QThread):
             
             self.progress_updated.emit(0, total_files, "Démarrage de la conversion...")
             
-            for i, file_info in enumerate(self.files_to_convert):
-                if not self.is_running:
-                    break
-                
-                # Émettre le progrès
-                self.progress_updated.emit(i + 1, total_files, f"Conversion de {file_info['name']}")
+            # Un fichier par worker; les résultats sont traités dans l'ordre d'achèvement
+            workers = max(1, min(self.file_manager.max_workers, total_files))
+            # Partager les workers entre fichiers et images pour ne pas multiplier les threads
+            self._inner_workers = max(1, self.file_manager.max_workers // workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                future_to_file = {}
+                for file_info in self.files_to_convert:
+                    future_to_file[executor.submit(self._convert_single_file, file_info)] = file_info
+                self._futures = list(future_to_file)
                 
-                try:
-                    # Conversion réelle
-                    success = self._convert_single_file(file_info)
+                for done_count, future in enumerate(as_completed(future_to_file), 1):
+                    if not self.is_running:
+                        break
                     
-                    if success:
-                        file_info['converted'] = True
-                        file_info['status'] = 'completed'
-                        converted_count += 1
-                        self.file_manager.logger.info(f"✅ Conversion réussie: {file_info['name']}")
-                    else:
+                    file_info = future_to_file[future]
+                    
+                    # Émettre le progrès
+                    self.progress_updated.emit(done_count, total_files, f"Conversion de {file_info['name']}")
+                    
+                    try:
+                        success = future.result()
+                        
+                        if success:
+                            file_info['converted'] = True
+                            file_info['status'] = 'completed'
+                            converted_count += 1
+                            self.file_manager.logger.info(f"✅ Conversion réussie: {file_info['name']}")
+                        else:
+                            file_info['status'] = 'failed'
+                            failed_count += 1
+                            self.file_manager.logger.error(f"❌ Conversion échouée: {file_info['name']}")
+                        
+                    except Exception as e:
                         file_info['status'] = 'failed'
+                        file_info['error'] = str(e)
                         failed_count += 1
-                        self.file_manager.logger.error(f"❌ Conversion échouée: {file_info['name']}")
+                        self.file_manager.logger.error(f"❌ Erreur conversion {file_info['name']}: {e}")
                     
                     # Émettre le signal de fichier converti
                     self.file_converted.emit(file_info)
-                    
-                except Exception as e:
-                    file_info['status'] = 'failed'
-                    file_info['error'] = str(e)
-                    failed_count += 1
-                    self.file_manager.logger.error(f"❌ Erreur conversion {file_info['name']}: {e}")
-                    self.file_converted.emit(file_info)
+                
+                # Arrêt demandé: abandonner les fichiers pas encore démarrés
+                for future in future_to_file:
+                    future.cancel()
             
             # Message final
             if self.is_running:
@@ -144,16 +216,17 @@ class ConversionWorker(QThread):
             }
             
             # Conversion selon le type de fichier
+            converter = thread_converter(self._local, self.file_manager, self._inner_workers)
             if file_ext == '.cbr':
-                success, message = self.file_manager.native_converter.convert_cbr_to_pdf(
+                success, message = converter.convert_cbr_to_pdf(
                     file_path, output_path, conversion_options
                 )
             elif file_ext == '.cbz':
-                success, message = self.file_manager.native_converter.convert_cbz_to_pdf(
+                success, message = converter.convert_cbz_to_pdf(
                     file_path, output_path, conversion_options
                 )
             elif file_ext == '.epub':
-                success, message = self.file_manager.native_converter.convert_epub_to_pdf(
+                success, message = converter.convert_epub_to_pdf(
                     file_path, output_path, conversion_options
                 )
             else:
@@ -169,6 +242,9 @@ class ConversionWorker(QThread):
     def stop(self):
         """Arrête la conversion"""
         self.is_running = False
+        # Les conversions en cours se terminent, les autres ne démarrent pas
+        for future in self._futures:
+            future.cancel()
 
 
 class MergeWorker(QThread):
@@ -182,6 +258,9 @@ class MergeWorker(QThread):
         self.files_to_merge = files_to_merge
         self.output_path = output_path
         self.is_running = True
+        self._futures = []
+        self._local = threading.local()
+        self._inner_workers = 1
         
     def run(self):
         """Exécute la fusion en arrière-plan"""
@@ -189,7 +268,8 @@ class MergeWorker(QThread):
             total_files = len(self.files_to_merge)
             converted_count = 0
             failed_count = 0
-            temp_pdfs = []
+            merged_pdfs = []
+            interrupted = False
             
             # Debug: afficher l'ordre reçu
             order_names = [f['name'] for f in self.files_to_merge]
@@ -197,57 +277,75 @@ class MergeWorker(QThread):
             
             self.progress_updated.emit(0, total_files, "Démarrage de la fusion...")
             
-            # Étape 1: Convertir tous les fichiers en PDFs temporaires
-            for i, file_info in enumerate(self.files_to_merge):
-                if not self.is_running:
-                    break
-                
-                # Émettre le progrès
-                self.progress_updated.emit(i + 1, total_files, f"Conversion de {file_info['name']}")
-                
-                try:
-                    # Conversion en PDF temporaire
-                    temp_pdf = self._convert_to_temp_pdf(file_info)
+            def ready_pdfs():
+                """Produit les PDFs temporaires dans l'ordre de fusion, dès qu'ils sont prêts"""
+                nonlocal converted_count, failed_count, interrupted
+                for i, (future, file_info) in enumerate(zip(futures, self.files_to_merge)):
+                    try:
+                        # Conversion en PDF temporaire (attend ce fichier, les suivants continuent)
+                        temp_pdf = future.result()
+                    except CancelledError:
+                        # Abandonné par stop() avant son démarrage
+                        temp_pdf = None
+                    except Exception as e:
+                        temp_pdf = None
+                        self.file_manager.logger.error(f"❌ Erreur conversion {file_info['name']}: {e}")
+                    
+                    if not self.is_running:
+                        interrupted = True
+                        return
+                    
+                    # Émettre le progrès
+                    self.progress_updated.emit(i + 1, total_files, f"Conversion de {file_info['name']}")
                     
                     if temp_pdf and os.path.exists(temp_pdf):
-                        temp_pdfs.append(temp_pdf)
                         converted_count += 1
+                        merged_pdfs.append(temp_pdf)
                         self.file_manager.logger.info(f"✅ Conversion réussie: {file_info['name']}")
+                        yield temp_pdf
                     else:
                         failed_count += 1
                         self.file_manager.logger.error(f"❌ Conversion échouée: {file_info['name']}")
-                    
-                except Exception as e:
-                    failed_count += 1
-                    self.file_manager.logger.error(f"❌ Erreur conversion {file_info['name']}: {e}")
+                
+                if merged_pdfs:
+                    self.progress_updated.emit(total_files, total_files, "Fusion des PDFs...")
+            
+            # Étape 1: Convertir les fichiers en PDFs temporaires, en parallèle
+            # Étape 2: les fusionner dans l'ordre choisi pendant que les suivants se convertissent
+            workers = max(1, min(self.file_manager.max_workers, total_files))
+            self._inner_workers = max(1, self.file_manager.max_workers // workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._convert_to_temp_pdf, file_info)
+                           for file_info in self.files_to_merge]
+                self._futures = futures
+                
+                try:
+                    success = self._merge_pdfs(ready_pdfs(), self.output_path)
+                finally:
+                    # Conversions devenues inutiles (arrêt ou échec de la fusion)
+                    for future in futures:
+                        future.cancel()
+            
+            # Tous les PDFs produits, y compris après un arrêt, pour le nettoyage
+            temp_pdfs = [future.result() for future in futures
+                         if not future.cancelled() and future.exception() is None and future.result()]
             
             # Debug: afficher l'ordre des PDFs temporaires
-            temp_names = [Path(p).name for p in temp_pdfs]
+            temp_names = [Path(p).name for p in merged_pdfs]
             self.file_manager.logger.info(f"DEBUG - Ordre des PDFs temporaires: {temp_names}")
             
-            # Étape 2: Fusionner tous les PDFs temporaires
-            if temp_pdfs and self.is_running:
-                self.progress_updated.emit(total_files, total_files, "Fusion des PDFs...")
-                
-                try:
-                    success = self._merge_pdfs(temp_pdfs, self.output_path)
-                    
-                    if success:
-                        self.file_manager.logger.info(f"✅ Fusion réussie: {len(temp_pdfs)} fichiers → {self.output_path}")
-                        message = f"Fusion terminée: {converted_count} fichiers fusionnés en {Path(self.output_path).name}"
-                        self.merge_finished.emit(True, message)
-                    else:
-                        message = f"Fusion échouée: {failed_count} erreurs"
-                        self.merge_finished.emit(False, message)
-                        
-                except Exception as e:
-                    self.file_manager.logger.error(f"❌ Erreur fusion: {e}")
-                    self.merge_finished.emit(False, f"Erreur fusion: {str(e)}")
+            if interrupted:
+                # Arrêt pendant la fusion: rien n'a été écrit sur output_path
+                self.merge_finished.emit(False, "Fusion arrêtée par l'utilisateur")
+            elif success:
+                self.file_manager.logger.info(f"✅ Fusion réussie: {len(merged_pdfs)} fichiers → {self.output_path}")
+                message = f"Fusion terminée: {converted_count} fichiers fusionnés en {Path(self.output_path).name}"
+                self.merge_finished.emit(True, message)
+            elif merged_pdfs:
+                message = f"Fusion échouée: {failed_count} erreurs"
+                self.merge_finished.emit(False, message)
             else:
-                if not self.is_running:
-                    self.merge_finished.emit(False, "Fusion arrêtée par l'utilisateur")
-                else:
-                    self.merge_finished.emit(False, "Aucun fichier à fusionner")
+                self.merge_finished.emit(False, "Aucun fichier à fusionner")
             
             # Nettoyer les fichiers temporaires
             self._cleanup_temp_files(temp_pdfs)
@@ -265,10 +363,8 @@ class MergeWorker(QThread):
             import uuid
             temp_name = f"temp_{uuid.uuid4().hex[:8]}.pdf"
             
-            # Utiliser le dossier temp du projet
-            temp_dir = Path(__file__).parent.parent.parent / "temp"
-            temp_dir.mkdir(exist_ok=True)
-            temp_path = temp_dir / temp_name
+            # Utiliser le dossier temporaire partagé du processus
+            temp_path = get_temp_dir() / temp_name
             
             # Options de conversion
             conversion_options = {
@@ -278,16 +374,17 @@ class MergeWorker(QThread):
             }
             
             # Conversion selon le type de fichier
+            converter = thread_converter(self._local, self.file_manager, self._inner_workers)
             if file_ext == '.cbr':
-                success, message = self.file_manager.native_converter.convert_cbr_to_pdf(
+                success, message = converter.convert_cbr_to_pdf(
                     file_path, str(temp_path), conversion_options
                 )
             elif file_ext == '.cbz':
-                success, message = self.file_manager.native_converter.convert_cbz_to_pdf(
+                success, message = converter.convert_cbz_to_pdf(
                     file_path, str(temp_path), conversion_options
                 )
             elif file_ext == '.epub':
-                success, message = self.file_manager.native_converter.convert_epub_to_pdf(
+                success, message = converter.convert_epub_to_pdf(
                     file_path, str(temp_path), conversion_options
                 )
             else:
@@ -300,31 +397,22 @@ class MergeWorker(QThread):
             self.file_manager.logger.error(f"❌ Erreur conversion {file_info['name']}: {e}")
             return None
     
-    def _merge_pdfs(self, pdf_paths: List[str], output_path: str) -> bool:
-        """Fusionne plusieurs PDFs en un seul"""
+    def _merge_pdfs(self, pdf_paths: Iterable[str], output_path: str) -> bool:
+        """Fusionne plusieurs PDFs en un seul (les chemins peuvent arriver au fil de l'eau)"""
+        # Écrire dans un fichier voisin puis le renommer: un fichier existant n'est
+        # remplacé que par une fusion complète
+        partial_path = f"{output_path}.part"
         try:
-            if not pdf_paths:
-                return False
-            
-            # Utiliser PyPDF2 pour fusionner les PDFs
-            from PyPDF2 import PdfMerger
-            
-            merger = PdfMerger()
+            # pikepdf (qpdf) greffe les pages en C++; PyPDF2 en repli s'il n'est pas installé
+            try:
+                merged_count = self._merge_with_pikepdf(pdf_paths, partial_path)
+            except ImportError:
+                merged_count = self._merge_with_pypdf2(pdf_paths, partial_path)
             
-            # Ajouter chaque PDF au merger
-            for pdf_path in pdf_paths:
-                if os.path.exists(pdf_path):
-                    with open(pdf_path, 'rb') as pdf_file:
-                        merger.append(pdf_file)
-                        self.file_manager.logger.debug(f"✅ PDF ajouté: {Path(pdf_path).name}")
-                else:
-                    self.file_manager.logger.warning(f"⚠️ PDF manquant: {pdf_path}")
+            if not merged_count or not self.is_running:
+                return False
             
-            # Écrire le PDF fusionné
-            with open(output_path, 'wb') as output_file:
-                merger.write(output_file)
-            
-            merger.close()
+            os.replace(partial_path, output_path)
             
             # Vérifier que le fichier a été créé
             if os.path.exists(output_path):
@@ -338,6 +426,57 @@ class MergeWorker(QThread):
         except Exception as e:
             self.file_manager.logger.error(f"❌ Erreur fusion PDFs: {e}")
             return False
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+    
+    def _merge_with_pikepdf(self, pdf_paths: Iterable[str], output_path: str) -> int:
+        """Fusionne avec pikepdf: objets et table xref construits par qpdf"""
+        import pikepdf
+        
+        # qpdf lit le contenu des pages dans les sources pendant save(): elles restent
+        # ouvertes jusque-là, mais seule la structure des objets est gardée en mémoire
+        merged_count = 0
+        with ExitStack() as sources, pikepdf.Pdf.new() as merged:
+            for pdf_path in pdf_paths:
+                if os.path.exists(pdf_path):
+                    source = sources.enter_context(pikepdf.open(pdf_path))
+                    merged.pages.extend(source.pages)
+                    merged_count += 1
+                    self.file_manager.logger.debug(f"✅ PDF ajouté: {Path(pdf_path).name}")
+                else:
+                    self.file_manager.logger.warning(f"⚠️ PDF manquant: {pdf_path}")
+            
+            # Écrire le PDF fusionné, sauf après un arrêt
+            if merged_count and self.is_running:
+                merged.save(output_path)
+        return merged_count
+    
+    def _merge_with_pypdf2(self, pdf_paths: Iterable[str], output_path: str) -> int:
+        """Fusionne avec PyPDF2"""
+        from PyPDF2 import PdfMerger
+        
+        merger = PdfMerger()
+        merged_count = 0
+        
+        try:
+            # Ajouter chaque PDF au merger par son chemin: PyPDF2 le lit alors sur disque
+            # au lieu de copier tout le fichier en mémoire comme pour un objet fichier
+            for pdf_path in pdf_paths:
+                if os.path.exists(pdf_path):
+                    merger.append(pdf_path)
+                    merged_count += 1
+                    self.file_manager.logger.debug(f"✅ PDF ajouté: {Path(pdf_path).name}")
+                else:
+                    self.file_manager.logger.warning(f"⚠️ PDF manquant: {pdf_path}")
+            
+            # Écrire le PDF fusionné (sauf après un arrêt), puis fermer les sources
+            if merged_count and self.is_running:
+                with open(output_path, 'wb') as output_file:
+                    merger.write(output_file)
+        finally:
+            merger.close()
+        return merged_count
     
     def _cleanup_temp_files(self, temp_files: List[str]):
         """Nettoie les fichiers temporaires"""
@@ -352,6 +491,9 @@ class MergeWorker(QThread):
     def stop(self):
         """Arrête la fusion"""
         self.is_running = False
+        # Les conversions en cours se terminent, les autres ne démarrent pas
+        for future in self._futures:
+            future.cancel()
 
 
 class CustomListWidget(QListWidget):
@@ -361,13 +503,29 @@ class CustomListWidget(QListWidget):
         super().__init__(parent)
         self.setDragDropMode(QListWidget.InternalMove)
         self.setAlternatingRowColors(True)
+        
+        # Regrouper les dépôts rapprochés en une seule mise à jour de l'ordre
+        self._order_timer = QTimer(self)
+        self._order_timer.setSingleShot(True)
+        self._order_timer.setInterval(30)
+        self._order_timer.timeout.connect(self._notify_order_changed)
     
     def dropEvent(self, event):
         """Surcharge de dropEvent pour mettre à jour l'ordre"""
         super().dropEvent(event)
-        # Émettre un signal personnalisé pour notifier le changement d'ordre
+        # Notification différée, redémarrée à chaque dépôt
+        self._order_timer.start()
+    
+    def _notify_order_changed(self):
+        """Notifie le parent du changement d'ordre"""
         if hasattr(self.parent(), 'on_order_changed'):
             self.parent().on_order_changed()
+    
+    def flush_order_changed(self):
+        """Applique immédiatement un changement d'ordre encore en attente"""
+        if self._order_timer.isActive():
+            self._order_timer.stop()
+            self._notify_order_changed()
 
 
 class MergeOrderDialog(QDialog):
@@ -458,12 +616,21 @@ class MergeOrderDialog(QDialog):
         self.update_order_from_list()
     
     def update_files_list(self):
-        self.files_list.clear()
-        for i, file_info in enumerate(self.ordered_files, 1):
-            size_mb = file_info.get('size', 0) / (1024 * 1024) if file_info.get('size', 0) > 0 else 0
-            item = QListWidgetItem(f"{i:2d}. {file_info['name']} ({size_mb:.1f} MB)")
-            item.setData(Qt.UserRole, file_info)
-            self.files_list.addItem(item)
+        # Suspendre le rendu: un seul recalcul de la liste après l'ajout des lignes
+        self.files_list.setUpdatesEnabled(False)
+        try:
+            self.files_list.clear()
+            for i, file_info in enumerate(self.ordered_files, 1):
+                item = QListWidgetItem(self._item_text(i, file_info))
+                item.setData(Qt.UserRole, file_info)
+                self.files_list.addItem(item)
+        finally:
+            self.files_list.setUpdatesEnabled(True)
+    
+    def _item_text(self, position, file_info):
+        """Libellé d'une ligne : numéro d'ordre, nom et taille"""
+        size_mb = file_info.get('size', 0) / (1024 * 1024) if file_info.get('size', 0) > 0 else 0
+        return f"{position:2d}. {file_info['name']} ({size_mb:.1f} MB)"
     
     def update_order_from_list(self):
         """Met à jour l'ordre des fichiers selon la liste actuelle"""
@@ -482,18 +649,22 @@ class MergeOrderDialog(QDialog):
     
     def update_numbers_only(self):
         """Met à jour seulement les numéros sans recréer la liste"""
-        for i in range(self.files_list.count()):
-            item = self.files_list.item(i)
-            if item:
-                file_info = item.data(Qt.UserRole)
-                if file_info:
-                    size_mb = file_info.get('size', 0) / (1024 * 1024) if file_info.get('size', 0) > 0 else 0
-                    item.setText(f"{i+1:2d}. {file_info['name']} ({size_mb:.1f} MB)")
+        self.files_list.setUpdatesEnabled(False)
+        try:
+            for i in range(self.files_list.count()):
+                item = self.files_list.item(i)
+                if item:
+                    file_info = item.data(Qt.UserRole)
+                    if file_info:
+                        item.setText(self._item_text(i + 1, file_info))
+        finally:
+            self.files_list.setUpdatesEnabled(True)
     
     def apply_quick_sort(self, sort_type):
+        self.files_list.flush_order_changed()
         if sort_type == "Ordre de sélection":
-            # Garder l'ordre de sélection original
-            pass
+            # Garder l'ordre actuel: la liste affichée est déjà à jour
+            return
         elif sort_type == "Ordre alphabétique (A-Z)":
             self.ordered_files.sort(key=lambda x: x['name'].lower())
         elif sort_type == "Ordre alphabétique inversé (Z-A)":
@@ -521,25 +692,35 @@ class MergeOrderDialog(QDialog):
     
     def _extract_number(self, file_info):
         """Extrait le premier nombre du nom de fichier pour le tri numérique"""
-        import re
-        name = file_info['name']
-        numbers = re.findall(r'\d+', name)
-        return int(numbers[0]) if numbers else 0
+        match = NUMBER_PATTERN.search(file_info['name'])
+        return int(match.group()) if match else 0
     
     def move_up(self):
         current_row = self.files_list.currentRow()
         if current_row > 0:
-            self.ordered_files.insert(current_row - 1, self.ordered_files.pop(current_row))
-            self.update_files_list()
+            self._swap_rows(current_row - 1, current_row)
             self.files_list.setCurrentRow(current_row - 1)
     
     def move_down(self):
         current_row = self.files_list.currentRow()
-        if current_row < len(self.ordered_files) - 1:
-            self.ordered_files.insert(current_row + 1, self.ordered_files.pop(current_row))
-            self.update_files_list()
+        if 0 <= current_row < len(self.ordered_files) - 1:
+            self._swap_rows(current_row, current_row + 1)
             self.files_list.setCurrentRow(current_row + 1)
     
+    def _swap_rows(self, upper, lower):
+        """Échange deux lignes adjacentes sans reconstruire toute la liste"""
+        # self.ordered_files doit refléter un éventuel dépôt encore en attente
+        self.files_list.flush_order_changed()
+        ordered = self.ordered_files
+        ordered[upper], ordered[lower] = ordered[lower], ordered[upper]
+        
+        item = self.files_list.takeItem(lower)
+        self.files_list.insertItem(upper, item)
+        
+        # Seuls les numéros des deux lignes échangées changent
+        for row in (upper, lower):
+            self.files_list.item(row).setText(self._item_text(row + 1, ordered[row]))
+    
     def get_ordered_files(self):
         """Récupère l'ordre actuel des fichiers depuis la liste"""
         # Mettre à jour l'ordre depuis la liste actuelle
@@ -563,9 +744,14 @@ class ModernInterface(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.file_manager = FileManager()
+        self.file_manager = FileManager(page_cache_file="page_cache.json")
         self.conversion_worker = None
+        self.scan_worker = None
         self.files = []
+        self._file_index = {}  # Chemin -> position dans self.files
+        self._tree_items = {}  # Chemin -> ligne affichée dans l'arbre
+        self._tree_rows = []  # (nom en minuscules, ligne) dans l'ordre d'affichage
+        self._applied_search = None  # Dernier terme de recherche appliqué aux lignes
         self.config_manager = ConfigManager()
         
         # Configuration de l'interface
@@ -705,8 +891,10 @@ class ModernInterface(QMainWindow):
         # Onglet Conversion
         self.setup_conversion_tab()
         
-        # Onglet Options
-        self.setup_options_tab()
+        # Onglet Options: widgets créés à la première ouverture de l'onglet
+        self._options_widget = QWidget()
+        self.tab_widget.addTab(self._options_widget, "Options")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Barre de statut
         self.status_label = QLabel("Prêt")
@@ -910,10 +1098,15 @@ class ModernInterface(QMainWindow):
         # Initialiser l'état des boutons
         self.update_conversion_buttons_state()
     
+    def _on_tab_changed(self, index: int):
+        """Crée le contenu de l'onglet des options lors de sa première ouverture"""
+        if self.tab_widget.widget(index) is self._options_widget and not hasattr(self, 'workers_spin'):
+            self.setup_options_tab()
+            self._load_options_config()
+    
     def setup_options_tab(self):
         """Configure l'onglet des options"""
-        options_widget = QWidget()
-        layout = QVBoxLayout(options_widget)
+        layout = QVBoxLayout(self._options_widget)
         
         # Section des performances
         performance_group = QGroupBox("Optimisations de Performance")
@@ -988,9 +1181,6 @@ class ModernInterface(QMainWindow):
         merge_layout.addRow("Ordre de fusion:", self.merge_order_combo)
         
         layout.addWidget(merge_group)
-        
-        # Ajouter l'onglet
-        self.tab_widget.addTab(options_widget, "Options")
     
     def setup_connections(self):
         """Configure les connexions entre les widgets"""
@@ -1008,17 +1198,41 @@ class ModernInterface(QMainWindow):
         self.convert_all_btn.clicked.connect(self.convert_all_files)
         self.stop_btn.clicked.connect(self.stop_conversion)
         
-        # Connexions pour la recherche et le tri (temps réel)
-        self.search_edit.textChanged.connect(self.filter_files)
-        self.sort_combo.currentTextChanged.connect(self.filter_files)
+        # Connexions pour la recherche et le tri (temps réel);
+        # la recherche n'est appliquée qu'après une courte pause de frappe
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.filter_files)
+        self._search_timer.timeout.connect(self.on_config_changed)
+        self.search_edit.textChanged.connect(self._search_timer.start)
+        self.sort_combo.currentTextChanged.connect(self.update_files_tree)
         
         # Connexions pour les fichiers
         self.files_tree.itemChanged.connect(self.on_file_selection_changed)
         
-        # Connexions pour la configuration
+        # Regrouper les mises à jour des boutons lors de changements rapides de sélection
+        self._buttons_state_timer = QTimer(self)
+        self._buttons_state_timer.setSingleShot(True)
+        self._buttons_state_timer.setInterval(30)
+        self._buttons_state_timer.timeout.connect(self.update_conversion_buttons_state)
+        
+        # Progression limitée à ~30 rafraîchissements par seconde; la dernière
+        # valeur reçue pendant l'intervalle est appliquée à son expiration
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Connexions pour la configuration: les changements rapprochés
+        # ne déclenchent qu'une sauvegarde
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(300)
+        self._config_save_timer.timeout.connect(self.save_current_config)
         self.input_path_edit.textChanged.connect(self.on_config_changed)
         self.output_path_edit.textChanged.connect(self.on_config_changed)
-        self.search_edit.textChanged.connect(self.on_config_changed)
         self.recursive_checkbox.toggled.connect(self.on_config_changed)
         self.sort_combo.currentTextChanged.connect(self.on_config_changed)
         
@@ -1034,23 +1248,23 @@ class ModernInterface(QMainWindow):
                 file_info['selected'] = is_checked
                 
                 # Mettre à jour la liste principale des fichiers
-                for i, f in enumerate(self.files):
-                    if f['path'] == file_info['path']:
-                        self.files[i]['selected'] = is_checked
-                        break
+                index = self._file_index.get(file_info.get('path'))
+                if index is not None:
+                    self.files[index]['selected'] = is_checked
                 
-                # Mettre à jour le statut
-                self.update_conversion_buttons_state()
+                # Mettre à jour le statut (différé de 30 ms, redémarré à chaque changement)
+                self._buttons_state_timer.start()
     
     def update_conversion_buttons_state(self):
         """Met à jour l'état des boutons de conversion"""
-        selected_files = [f for f in self.files if f.get('selected', False)]
+        # Compter sans construire de liste intermédiaire
+        selected_count = sum(1 for f in self.files if f.get('selected', False))
         has_files = len(self.files) > 0
         
         # Activer le bouton de sélection seulement s'il y a des fichiers sélectionnés
-        self.convert_selected_btn.setEnabled(len(selected_files) > 0)
+        self.convert_selected_btn.setEnabled(selected_count > 0)
         self.convert_all_btn.setEnabled(has_files)
-        self.merge_selected_btn.setEnabled(len(selected_files) > 1)  # Au moins 2 fichiers pour fusionner
+        self.merge_selected_btn.setEnabled(selected_count > 1)  # Au moins 2 fichiers pour fusionner
         
     def merge_selected_files(self):
         """Fusionne les fichiers sélectionnés"""
@@ -1132,19 +1346,14 @@ class ModernInterface(QMainWindow):
         # Essayer d'extraire le nom de la série du premier fichier
         first_file = selected_files[0]['name']
         
-        # Patterns pour extraire le nom de la série
-        import re
-        
         # Pattern: Series - Volume XX - Chapter XXX
-        pattern1 = r'^(.+?)\s*[-_]\s*[Vv]olume\s*\d+'
-        match = re.search(pattern1, first_file)
+        match = MERGE_VOLUME_PATTERN.search(first_file)
         if match:
             series_name = match.group(1).strip()
             return f"{series_name}_merged.pdf"
         
         # Pattern: Series Vol.XX Ch.XXX
-        pattern2 = r'^(.+?)\s+[Vv]ol\.?\s*\d+'
-        match = re.search(pattern2, first_file)
+        match = MERGE_VOL_PATTERN.search(first_file)
         if match:
             series_name = match.group(1).strip()
             return f"{series_name}_merged.pdf"
@@ -1228,34 +1437,66 @@ class ModernInterface(QMainWindow):
             QMessageBox.critical(self, "Erreur", f"Le répertoire n'existe pas:\n{input_path}")
             return
         
+        if self.scan_worker and self.scan_worker.isRunning():
+            return
+        
         try:
             self.add_log_message(f"🔍 Scan du répertoire: {input_path}", "INFO")
+            self.scan_btn.setEnabled(False)
             
-            # Scanner les fichiers
+            # Scanner les fichiers en arrière-plan
             recursive = self.recursive_checkbox.isChecked()
-            self.files = self.file_manager.scan_directory(input_path, recursive=recursive)
-            
-            # Mettre à jour l'arbre des fichiers
-            self.update_files_tree()
-            
-            # Mettre à jour l'état des boutons
-            self.update_conversion_buttons_state()
-            
-            self.add_log_message(f"✅ Scan terminé: {len(self.files)} fichiers trouvés", "INFO")
+            self.scan_worker = ScanWorker(self.file_manager, input_path, recursive)
+            self.scan_worker.scan_finished.connect(self.on_scan_finished)
+            self.scan_worker.scan_failed.connect(self.on_scan_failed)
+            self.scan_worker.start()
             
         except Exception as e:
-            error_msg = f"Erreur lors du scan: {e}"
-            self.add_log_message(error_msg, "ERROR")
-            QMessageBox.critical(self, "Erreur", error_msg)
+            self.on_scan_failed(str(e))
+    
+    def on_scan_finished(self, files: List[Dict]):
+        """Appelé quand le scan est terminé"""
+        self.scan_btn.setEnabled(True)
+        self.files = files
+        
+        # Mettre à jour l'arbre des fichiers
+        self.update_files_tree()
+        
+        # Mettre à jour l'état des boutons
+        self.update_conversion_buttons_state()
+        
+        self.add_log_message(f"✅ Scan terminé: {len(self.files)} fichiers trouvés", "INFO")
+    
+    def on_scan_failed(self, message: str):
+        """Appelé quand le scan a échoué"""
+        self.scan_btn.setEnabled(True)
+        error_msg = f"Erreur lors du scan: {message}"
+        self.add_log_message(error_msg, "ERROR")
+        QMessageBox.critical(self, "Erreur", error_msg)
     
     def update_files_tree(self):
         """Met à jour l'arbre des fichiers"""
         if not hasattr(self, 'files_tree'):
             return
         
-        # Bloquer les signaux pendant la mise à jour
+        # Bloquer les signaux et suspendre le rendu pendant la mise à jour
         self.files_tree.blockSignals(True)
+        self.files_tree.setUpdatesEnabled(False)
+        try:
+            self._rebuild_files_tree()
+        finally:
+            self.files_tree.setUpdatesEnabled(True)
+            # Débloquer les signaux
+            self.files_tree.blockSignals(False)
+        
+        # Mettre à jour l'état des boutons
+        self.update_conversion_buttons_state()
+    
+    def _rebuild_files_tree(self):
+        """Recrée les lignes de l'arbre (signaux bloqués et rendu suspendu par l'appelant)"""
         self.files_tree.clear()
+        self._tree_items = {}
+        self._tree_rows = []
         
         if not self.files:
             return
@@ -1271,15 +1512,13 @@ class ModernInterface(QMainWindow):
         elif sort_by == "date":
             self.files.sort(key=lambda x: x.get('modified', 0), reverse=True)
         
-        # Appliquer le filtre de recherche
-        search_term = self.search_edit.text().lower()
-        filtered_files = self.files
+        # Index chemin -> position, reconstruit après le tri
+        self._file_index = {f.get('path'): i for i, f in enumerate(self.files)}
         
-        if search_term:
-            filtered_files = [f for f in self.files if search_term in f['name'].lower()]
-        
-        # Ajouter les fichiers à l'arbre
-        for file_info in filtered_files:
+        # Construire les items puis les ajouter à l'arbre en une seule fois;
+        # le filtre de recherche masque ensuite les lignes sans les recréer
+        items = []
+        for file_info in self.files:
             item = QTreeWidgetItem()
             
             # Nom du fichier (plus lisible)
@@ -1290,42 +1529,14 @@ class ModernInterface(QMainWindow):
             item.setToolTip(0, file_info['name'])  # Tooltip avec le nom complet
             
             # Taille formatée
-            size = file_info.get('size', 0)
-            if size > 0:
-                if size < 1024:
-                    size_str = f"{size} B"
-                elif size < 1024 * 1024:
-                    size_str = f"{size / 1024:.1f} KB"
-                else:
-                    size_str = f"{size / (1024 * 1024):.1f} MB"
-            else:
-                size_str = "N/A"
-            item.setText(1, size_str)
+            item.setText(1, self._format_size(file_info.get('size', 0)))
             
             # Nombre de pages
             pages = file_info.get('pages', 0)
             item.setText(2, str(pages) if pages > 0 else "N/A")
             
             # Statut
-            status = file_info.get('status', 'pending')
-            status_text = {
-                'pending': '⏳ En attente',
-                'converting': '🔄 Conversion...',
-                'completed': '✅ Terminé',
-                'failed': '❌ Échoué',
-                'merged': '📄 Fusionné'
-            }.get(status, '⏳ En attente')
-            item.setText(3, status_text)
-            
-            # Couleur selon le statut
-            if status == 'completed':
-                item.setForeground(3, QColor('#00AA00'))  # Vert
-            elif status == 'failed':
-                item.setForeground(3, QColor('#FF0000'))  # Rouge
-            elif status == 'converting':
-                item.setForeground(3, QColor('#FFAA00'))  # Orange
-            elif status == 'merged':
-                item.setForeground(3, QColor('#0088FF'))  # Bleu
+            self._set_item_status(item, file_info.get('status', 'pending'))
             
             # Case à cocher pour la sélection
             item.setCheckState(0, Qt.Checked if file_info.get('selected', False) else Qt.Unchecked)
@@ -1333,23 +1544,58 @@ class ModernInterface(QMainWindow):
             # Stocker les données du fichier
             item.setData(0, Qt.UserRole, file_info)
             
-            # Ajouter l'item à l'arbre
-            self.files_tree.addTopLevelItem(item)
+            items.append(item)
+            self._tree_items[file_info.get('path')] = item
+            # Nom en minuscules calculé une fois pour toutes les recherches
+            self._tree_rows.append((file_info['name'].lower(), item))
+        
+        self.files_tree.addTopLevelItems(items)
+        self._apply_search_filter()
         
         # Mettre à jour le nombre de fichiers
         total_files = len(self.files)
-        selected_files = len([f for f in self.files if f.get('selected', False)])
+        selected_files = sum(1 for f in self.files if f.get('selected', False))
         
         # Mettre à jour le titre du groupe
         files_group_title = f"Fichiers ({selected_files}/{total_files} sélectionnés)"
         if hasattr(self, 'files_group'):
             self.files_group.setTitle(files_group_title)
+    
+    def _apply_search_filter(self) -> int:
+        """Masque les lignes qui ne correspondent pas à la recherche et retourne le nombre visible"""
+        search_term = self.search_edit.text().strip().lower()
+        self._applied_search = search_term
+        visible = 0
+        for name_lower, item in self._tree_rows:
+            hidden = bool(search_term) and search_term not in name_lower
+            # Ne toucher que les lignes dont l'état change
+            if item.isHidden() != hidden:
+                item.setHidden(hidden)
+            if not hidden:
+                visible += 1
+        return visible
+    
+    def _set_item_status(self, item: QTreeWidgetItem, status: str):
+        """Met à jour le texte et la couleur de la colonne statut d'une ligne"""
+        status_text, color = STATUS_DISPLAY.get(status, STATUS_DISPLAY['pending'])
+        # Ligne déjà à jour: éviter des notifications de modification inutiles
+        if item.text(3) == status_text:
+            return
+        item.setText(3, status_text)
         
-        # Débloquer les signaux
-        self.files_tree.blockSignals(False)
-        
-        # Mettre à jour l'état des boutons
-        self.update_conversion_buttons_state()
+        # Couleur selon le statut
+        if color is not None:
+            item.setForeground(3, color)
+    
+    def _format_size(self, size: int) -> str:
+        """Formate une taille en octets (index d'unité calculé par log2, tables précalculées)"""
+        if size <= 0:
+            return "N/A"
+        if size < 1024:
+            return f"{size} B"
+        
+        i = min(int(size).bit_length() - 1, 10 * len(SIZE_UNITS) - 1) // 10
+        return f"{size * SIZE_SCALES[i]:.1f} {SIZE_UNITS[i]}"
     
     def select_all_files(self):
         """Sélectionne tous les fichiers"""
@@ -1394,13 +1640,17 @@ class ModernInterface(QMainWindow):
         if not hasattr(self, 'files') or not self.files:
             return
         
-        # Mettre à jour l'arbre des fichiers avec les nouveaux filtres
-        self.update_files_tree()
+        # Masquer/afficher les lignes existantes; reconstruire seulement si l'arbre est périmé
+        search_term = self.search_edit.text().strip()
+        if len(self._tree_rows) != len(self.files):
+            self.update_files_tree()
+        elif search_term.lower() == self._applied_search:
+            # Recherche inchangée (ex. espaces ajoutés): rien à refaire
+            return
+        filtered_count = self._apply_search_filter()
         
         # Ajouter un message de log si des filtres sont appliqués
-        search_term = self.search_edit.text().strip()
         if search_term:
-            filtered_count = len([f for f in self.files if search_term.lower() in f['name'].lower()])
             self.add_log_message(f"🔍 Recherche '{search_term}': {filtered_count} fichiers trouvés", "INFO")
     
     def convert_selected_files(self):
@@ -1520,28 +1770,54 @@ class ModernInterface(QMainWindow):
     
     def update_progress(self, current: int, total: int, message: str):
         """Met à jour la barre de progression et ajoute un message aux logs"""
+        # Ajouter le message aux logs (chaque message est conservé)
+        self.add_log_message(message, "INFO")
+        
+        # Barre et statut: appliqués tout de suite, puis au plus une fois par intervalle
+        if self._progress_timer.isActive():
+            self._pending_progress = (current, total, message)
+        else:
+            self._apply_progress(current, total, message)
+            self._progress_timer.start()
+    
+    def _apply_progress(self, current: int, total: int, message: str):
+        """Affiche une valeur de progression dans la barre et le label de statut"""
         if hasattr(self, 'progress_bar'):
             self.progress_bar.setMaximum(total)
             self.progress_bar.setValue(current)
         
-        # Ajouter le message aux logs
-        self.add_log_message(message, "INFO")
-        
         # Mettre à jour le label de statut
         if hasattr(self, 'status_label'):
             self.status_label.setText(message)
     
+    def _flush_progress(self):
+        """Applique la dernière progression reçue pendant l'intervalle"""
+        if self._pending_progress is not None:
+            pending, self._pending_progress = self._pending_progress, None
+            self._apply_progress(*pending)
+            self._progress_timer.start()
+    
+    def _discard_pending_progress(self):
+        """Oublie une progression en attente pour qu'elle n'écrase pas l'état final"""
+        self._progress_timer.stop()
+        self._pending_progress = None
+    
     def on_file_converted(self, file_info: Dict):
         """Appelé quand un fichier est converti"""
         status = "✅ Réussi" if file_info.get('converted', False) else "❌ Échoué"
         message = f"{status}: {file_info['name']}"
         self.add_log_message(message, "INFO" if file_info.get('converted', False) else "ERROR")
         
-        # Mettre à jour l'arbre des fichiers
-        self.update_files_tree()
+        # Mettre à jour uniquement la ligne du fichier converti
+        item = self._tree_items.get(file_info.get('path'))
+        if item is None:
+            self.update_files_tree()
+        else:
+            self._set_item_status(item, file_info.get('status', 'pending'))
     
     def on_conversion_finished(self, success: bool, message: str):
         """Appelé quand la conversion est terminée"""
+        self._discard_pending_progress()
         level = "INFO" if success else "ERROR"
         self.add_log_message(message, level)
         
@@ -1565,6 +1841,7 @@ class ModernInterface(QMainWindow):
     
     def on_merge_finished(self, success: bool, message: str):
         """Appelé quand la fusion est terminée"""
+        self._discard_pending_progress()
         level = "INFO" if success else "ERROR"
         self.add_log_message(message, level)
         
@@ -1597,6 +1874,7 @@ class ModernInterface(QMainWindow):
             self.merge_worker.stop()
             self.merge_worker.wait()
         
+        self._discard_pending_progress()
         self.progress_bar.setVisible(False)
         self.convert_selected_btn.setEnabled(True)
         self.convert_all_btn.setEnabled(True)
@@ -1606,22 +1884,24 @@ class ModernInterface(QMainWindow):
     
     def closeEvent(self, event):
         """Gère la fermeture de l'application"""
-        if self.conversion_worker and self.conversion_worker.isRunning():
+        workers = (self.conversion_worker, getattr(self, 'merge_worker', None))
+        if any(worker and worker.isRunning() for worker in workers):
             reply = QMessageBox.question(
                 self, "Confirmation",
                 "Une conversion est en cours. Voulez-vous vraiment quitter ?",
                 QMessageBox.Yes | QMessageBox.No
             )
             
-            if reply == QMessageBox.Yes:
-                self.stop_conversion()
-                event.accept()
-            else:
+            if reply != QMessageBox.Yes:
                 event.ignore()
-        else:
-            # Sauvegarder la configuration avant de fermer
-            self.save_current_config()
-            event.accept()
+                return
+            
+            self.stop_conversion()
+        
+        # Sauvegarder la configuration avant de fermer, y compris les changements en attente
+        self._config_save_timer.stop()
+        self.save_current_config()
+        event.accept()
     
     def load_saved_config(self):
         """Charge la configuration sauvegardée"""
@@ -1640,6 +1920,20 @@ class ModernInterface(QMainWindow):
             if hasattr(self, 'output_path_edit') and output_folder:
                 self.output_path_edit.setText(output_folder)
             
+            # Options de l'onglet dédié (ignorées tant qu'il n'a pas été ouvert)
+            self._load_options_config()
+            
+            # Charger les filtres
+            last_search = self.config_manager.get('last_search_term', '')
+            if hasattr(self, 'search_edit'):
+                self.search_edit.setText(last_search)
+            
+        except Exception as e:
+            self.add_log_message(f"⚠️ Erreur lors du chargement de la configuration: {e}", "ERROR")
+    
+    def _load_options_config(self):
+        """Applique la configuration sauvegardée aux widgets de l'onglet des options"""
+        try:
             # Charger les options de conversion
             max_workers = self.config_manager.get('max_workers', 5)
             if hasattr(self, 'workers_spin'):
@@ -1685,11 +1979,6 @@ class ModernInterface(QMainWindow):
             if hasattr(self, 'add_metadata_checkbox'):
                 self.add_metadata_checkbox.setChecked(add_metadata)
             
-            # Charger les filtres
-            last_search = self.config_manager.get('last_search_term', '')
-            if hasattr(self, 'search_edit'):
-                self.search_edit.setText(last_search)
-            
         except Exception as e:
             self.add_log_message(f"⚠️ Erreur lors du chargement de la configuration: {e}", "ERROR")
     
@@ -1697,59 +1986,62 @@ class ModernInterface(QMainWindow):
         """Sauvegarde la configuration actuelle"""
         try:
             # Sauvegarder la taille de la fenêtre
-            self.config_manager.set('window_width', self.width())
-            self.config_manager.set('window_height', self.height())
+            self.config_manager.set('window_width', self.width(), save=False)
+            self.config_manager.set('window_height', self.height(), save=False)
             
             # Sauvegarder les chemins
             if hasattr(self, 'input_path_edit'):
                 input_folder = self.input_path_edit.text()
-                self.config_manager.set('input_folder', input_folder)
+                self.config_manager.set('input_folder', input_folder, save=False)
             
             if hasattr(self, 'output_path_edit'):
                 output_folder = self.output_path_edit.text()
-                self.config_manager.set('output_folder', output_folder)
+                self.config_manager.set('output_folder', output_folder, save=False)
             
             # Sauvegarder les options de conversion
             if hasattr(self, 'workers_spin'):
-                self.config_manager.set('max_workers', self.workers_spin.value())
+                self.config_manager.set('max_workers', self.workers_spin.value(), save=False)
             
             # Sauvegarder les options de fusion
             if hasattr(self, 'merge_volumes_check'):
-                self.config_manager.set('merge_volumes', self.merge_volumes_check.isChecked())
+                self.config_manager.set('merge_volumes', self.merge_volumes_check.isChecked(), save=False)
             
             if hasattr(self, 'fetch_metadata_check'):
-                self.config_manager.set('fetch_metadata', self.fetch_metadata_check.isChecked())
+                self.config_manager.set('fetch_metadata', self.fetch_metadata_check.isChecked(), save=False)
             
             if hasattr(self, 'merge_order_combo'):
                 merge_order = self.merge_order_combo.currentText()
-                self.config_manager.set('merge_order', merge_order)
+                self.config_manager.set('merge_order', merge_order, save=False)
             
             # Sauvegarder les options de conversion
             if hasattr(self, 'output_format_combo'):
                 output_format = self.output_format_combo.currentText()
-                self.config_manager.set('output_format', output_format)
+                self.config_manager.set('output_format', output_format, save=False)
             
             if hasattr(self, 'resize_combo'):
                 resize_option = self.resize_combo.currentText()
-                self.config_manager.set('resize_option', resize_option)
+                self.config_manager.set('resize_option', resize_option, save=False)
             
             if hasattr(self, 'grayscale_checkbox'):
-                self.config_manager.set('grayscale', self.grayscale_checkbox.isChecked())
+                self.config_manager.set('grayscale', self.grayscale_checkbox.isChecked(), save=False)
             
             if hasattr(self, 'optimize_checkbox'):
-                self.config_manager.set('optimize', self.optimize_checkbox.isChecked())
+                self.config_manager.set('optimize', self.optimize_checkbox.isChecked(), save=False)
             
             if hasattr(self, 'add_metadata_checkbox'):
-                self.config_manager.set('add_metadata', self.add_metadata_checkbox.isChecked())
+                self.config_manager.set('add_metadata', self.add_metadata_checkbox.isChecked(), save=False)
             
             # Sauvegarder les filtres
             if hasattr(self, 'search_edit'):
                 search_term = self.search_edit.text()
-                self.config_manager.set('last_search_term', search_term)
+                self.config_manager.set('last_search_term', search_term, save=False)
+            
+            # Une seule écriture pour l'ensemble des options
+            self.config_manager.flush()
             
         except Exception as e:
             self.add_log_message(f"⚠️ Erreur lors de la sauvegarde de la configuration: {e}", "ERROR")
     
     def on_config_changed(self):
-        """Appelé quand la configuration change"""
-        self.save_current_config()
+        """Appelé quand la configuration change (sauvegarde regroupée sur le thread GUI)"""
+        self._config_save_timer.start()
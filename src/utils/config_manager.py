@@ -15,6 +15,8 @@ class ConfigManager:
         self.config_file = Path(config_file)
         self.logger = logging.getLogger('epub2pdf')
         self.config = self._load_config()
+        # Modifications en mémoire pas encore écrites (set(..., save=False))
+        self._dirty = False
     
     def _load_config(self) -> Dict[str, Any]:
         """Charge la configuration depuis le fichier"""
@@ -56,11 +58,10 @@ class ConfigManager:
         
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Fusionner avec les valeurs par défaut
-                    default_config.update(loaded_config)
-                    self.logger.debug(f"Configuration chargée: {self.config_file}")
+                loaded_config = self._loads(self.config_file.read_bytes())
+                # Fusionner avec les valeurs par défaut
+                default_config.update(loaded_config)
+                self.logger.debug(f"Configuration chargée: {self.config_file}")
             except (json.JSONDecodeError, IOError) as e:
                 self.logger.warning(f"Erreur chargement configuration: {e}")
         
@@ -69,25 +70,59 @@ class ConfigManager:
     def _save_config(self):
         """Sauvegarde la configuration dans le fichier"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            # Sérialiser en mémoire puis écrire en un seul appel
+            self.config_file.write_bytes(self._dumps(self.config))
             self.logger.debug(f"Configuration sauvegardée: {self.config_file}")
         except IOError as e:
             self.logger.error(f"Erreur sauvegarde configuration: {e}")
     
+    def flush(self):
+        """Écrit les modifications en attente, s'il y en a"""
+        if self._dirty:
+            self._dirty = False
+            self._save_config()
+    
+    def _dumps(self, config: Dict[str, Any]) -> bytes:
+        """Sérialise la configuration (orjson si disponible)"""
+        try:
+            import orjson
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        except (ImportError, TypeError):
+            return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def _loads(self, data: bytes) -> Dict[str, Any]:
+        """Désérialise la configuration (orjson si disponible)"""
+        try:
+            import orjson
+        except ImportError:
+            return json.loads(data)
+        return orjson.loads(data)
+    
     def get(self, key: str, default=None):
         """Récupère une valeur de configuration"""
         return self.config.get(key, default)
     
-    def set(self, key: str, value: Any):
-        """Définit une valeur de configuration et sauvegarde"""
-        self.config[key] = value
-        self._save_config()
+    def set(self, key: str, value: Any, save: bool = True):
+        """Définit une valeur de configuration et sauvegarde
+        
+        Avec save=False, la valeur reste en mémoire jusqu'au prochain flush(),
+        ce qui permet de regrouper plusieurs modifications en une seule écriture.
+        """
+        # Éviter une réécriture du fichier si la valeur est inchangée
+        if key not in self.config or self.config[key] != value:
+            self.config[key] = value
+            self._dirty = True
+        if save:
+            self.flush()
     
     def update(self, config_dict: Dict[str, Any]):
         """Met à jour plusieurs valeurs de configuration et sauvegarde"""
-        self.config.update(config_dict)
-        self._save_config()
+        changes = {key: value for key, value in config_dict.items()
+                   if key not in self.config or self.config[key] != value}
+        if changes:
+            self.config.update(changes)
+            self._dirty = True
+        self.flush()
     
     def get_all(self) -> Dict[str, Any]:
         """Récupère toute la configuration"""
@@ -96,4 +131,5 @@ class ConfigManager:
     def reset_to_defaults(self):
         """Remet la configuration aux valeurs par défaut"""
         self.config = self._load_config()
+        self._dirty = False
         self._save_config()
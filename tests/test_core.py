@@ -40,8 +40,23 @@ class TestFileManager:
     def test_set_max_workers(self):
         """Test de la configuration du nombre de workers"""
         fm = FileManager()
-        fm.set_max_workers(4)
-        assert fm.max_workers == 4
+        with patch('os.cpu_count', return_value=8):
+            fm.set_max_workers(4)
+        # Peut être limité par la mémoire disponible
+        assert 1 <= fm.max_workers <= 4
+
+    def test_set_max_workers_capped(self):
+        """Test de la limitation des workers par la mémoire et les CPU"""
+        fm = FileManager()
+        memory = Mock(available=2 * 512 * 1024 * 1024)
+        with patch('os.cpu_count', return_value=8), \
+                patch('psutil.virtual_memory', return_value=memory):
+            fm.set_max_workers(16)
+        assert fm.max_workers == 2
+
+        with patch('os.cpu_count', return_value=3):
+            fm.set_max_workers(16)
+        assert fm.max_workers <= 3
 
     def test_scan_directory_simple(self, temp_dir):
         """Test du scan de répertoire simple"""
@@ -159,6 +174,95 @@ class TestFileManager:
         # Vérifier que le callback a été appelé
         assert callback_called
     
+    def test_convert_files_callback_batch(self):
+        """Test des notifications groupées et des compteurs de conversion"""
+        fm = FileManager()
+
+        batches = []
+        files = [
+            {'name': f'test{i}.cbz', 'path': f'/test/path{i}', 'extension': '.cbz'}
+            for i in range(3)
+        ]
+
+        fm.convert_files(files, callback_batch=batches.append)
+
+        # Tous les fichiers sont notifiés, regroupés par lots
+        assert sum(len(batch) for batch in batches) == 3
+        stats = fm.get_conversion_stats()
+        assert stats['converted_files'] + stats['failed_files'] == 3
+
+    def test_get_conversion_stats_during_conversion(self):
+        """Test de la lecture des compteurs pendant une conversion"""
+        fm = FileManager()
+
+        seen = []
+        files = [
+            {'name': f'test{i}.cbz', 'path': f'/test/path{i}', 'extension': '.cbz'}
+            for i in range(3)
+        ]
+
+        fm.convert_files(files, callback=lambda f: seen.append(fm.get_conversion_stats()))
+
+        # Chaque lecture voit le fichier qui vient de se terminer, sans incrément parasite
+        assert [s['converted_files'] + s['failed_files'] for s in seen] == [1, 2, 3]
+        stats = fm.get_conversion_stats()
+        assert stats['end_time'] is not None
+        assert stats['converted_files'] + stats['failed_files'] == 3
+
+    def test_convert_files_callback_error(self):
+        """Test de la poursuite de la conversion malgré un callback en erreur"""
+        fm = FileManager()
+
+        def callback(file_info):
+            raise RuntimeError("callback")
+
+        files = [
+            {'name': f'test{i}.cbz', 'path': f'/test/path{i}', 'extension': '.cbz'}
+            for i in range(3)
+        ]
+
+        fm.convert_files(files, callback=callback)
+
+        stats = fm.get_conversion_stats()
+        assert stats['converted_files'] + stats['failed_files'] == 3
+        assert stats['end_time'] is not None
+
+    def test_iter_scan(self, sample_files, temp_dir):
+        """Test du scan en flux"""
+        fm = FileManager()
+
+        scanned = list(fm.iter_scan(str(temp_dir), recursive=True))
+
+        assert sorted(f['path'] for f in scanned) == sorted(sample_files)
+
+    def test_convert_stream(self, sample_files, temp_dir):
+        """Test de la conversion en flux à partir du scan"""
+        fm = FileManager()
+
+        converted = []
+        fm.convert_stream(fm.iter_scan(str(temp_dir)), callback=converted.append)
+
+        assert len(converted) == len(sample_files)
+        stats = fm.get_conversion_stats()
+        assert stats['total_files'] == len(sample_files)
+        assert not fm.is_converting
+
+    def test_convert_stream_stop(self):
+        """Test de l'arrêt d'une conversion en flux"""
+        fm = FileManager()
+
+        produced = []
+        def files():
+            for i in range(50):
+                produced.append(i)
+                yield {'name': f'test{i}.cbz', 'path': f'/test/path{i}', 'extension': '.cbz'}
+
+        fm.convert_stream(files(), callback=lambda f: fm.stop_conversion())
+
+        # Le générateur n'est plus consommé après l'arrêt
+        assert len(produced) < 50
+        assert not fm.is_converting
+
     def test_stop_conversion(self):
         """Test de l'arrêt de la conversion"""
         fm = FileManager()
@@ -182,6 +286,67 @@ class TestFileManager:
         # Vérifier que les caches sont vides
         assert len(fm._file_cache) == 0
         assert len(fm._scan_cache) == 0
+    
+    def test_extract_metadata(self):
+        """Test de l'extraction des métadonnées depuis le nom de fichier"""
+        fm = FileManager()
+        
+        assert fm._extract_metadata("Naruto - Volume 01 - Chapter 001.cbz") == ("Naruto", "Volume 01", "Chapter 001")
+        assert fm._extract_metadata("One Piece Vol.02 Ch.010.cbr") == ("One Piece", "Vol.02", "Ch.010")
+        assert fm._extract_metadata("Bleach 03-025.cbz") == ("Bleach", "Vol.03", "Ch.025")
+        assert fm._extract_metadata("Artbook.epub") == ("Artbook", "", "")
+        assert fm._extract_metadata("Berserk_Volume 05_Chapter 040.cbz") == ("Berserk", "Volume 05", "Chapter 040")
+        assert fm._extract_metadata("Artbook 2024.epub") == ("Artbook 2024", "", "")
+    
+    def test_count_pages_cache(self, temp_dir):
+        """Test du cache du nombre de pages invalidé par la modification du fichier"""
+        fm = FileManager()
+        test_file = temp_dir / "test.epub"
+        test_file.write_bytes(b"x" * 50 * 1024)
+        
+        assert fm._count_pages(str(test_file)) == 1
+        
+        # Fichier modifié: la taille change, le cache est ignoré
+        test_file.write_bytes(b"x" * 150 * 1024)
+        assert fm._count_pages(str(test_file)) == 3
+    
+    def test_page_cache_persisted(self, temp_dir):
+        """Test de la réutilisation du nombre de pages d'une session à l'autre"""
+        cache_file = temp_dir / "page_cache.json"
+        test_file = temp_dir / "test.cbz"
+        test_file.write_bytes(b"archive")
+        
+        fm = FileManager(page_cache_file=str(cache_file))
+        with patch.object(fm.native_converter.extractor, 'is_zip_archive', return_value=True), \
+             patch.object(fm.native_converter.extractor, 'list_cbz_images', return_value=["1.jpg", "2.jpg"]):
+            assert fm._count_pages(str(test_file)) == 2
+        fm.save_page_cache()
+        
+        # Nouvelle session: l'archive n'est pas rouverte
+        fm = FileManager(page_cache_file=str(cache_file))
+        with patch.object(fm.native_converter.extractor, 'list_cbz_images') as mock_list:
+            assert fm._count_pages(str(test_file)) == 2
+            mock_list.assert_not_called()
+    
+    def test_create_file_info_cache(self, temp_dir):
+        """Test du cache des informations de fichiers par (chemin, mtime, taille)"""
+        fm = FileManager()
+        test_file = temp_dir / "test.epub"
+        test_file.write_text("contenu")
+        
+        info = fm._create_file_info(str(test_file))
+        info['selected'] = True
+        
+        # Deuxième appel servi par le cache, sans l'état modifié par l'appelant
+        with patch.object(fm, '_count_pages') as mock_count:
+            cached = fm._create_file_info(str(test_file))
+            mock_count.assert_not_called()
+        assert cached['name'] == "test.epub"
+        assert cached['selected'] is False
+        
+        # Un fichier modifié invalide l'entrée
+        test_file.write_text("contenu plus long")
+        assert fm._create_file_info(str(test_file))['size'] == len("contenu plus long")
 
 
 class TestNativeConverter:
@@ -279,6 +444,67 @@ class TestExtractor:
             # Acceptable avec des données factices
             assert "image" in str(e).lower() or "extract" in str(e).lower()
 
+    def test_cbr_zip_detection(self, temp_dir):
+        """Test de la détection d'un CBR au format ZIP"""
+        extractor = Extractor()
+        
+        test_file = temp_dir / "test.cbr"
+        import zipfile
+        with zipfile.ZipFile(test_file, 'w') as zf:
+            zf.writestr("page_001.jpg", "fake_image_data")
+        assert extractor.is_zip_archive(str(test_file))
+        
+        rar_file = temp_dir / "real.cbr"
+        rar_file.write_bytes(b"Rar!\x1a\x07\x00")
+        assert not extractor.is_zip_archive(str(rar_file))
+        
+        # Le CBR ZIP passe par l'extraction ZIP, sans unar
+        with patch.object(extractor, '_extract_with_unrar') as mock_unar:
+            images = extractor.extract_cbr(str(test_file))
+            mock_unar.assert_not_called()
+        assert len(images) == 1
+    
+    def test_get_image_files_nested(self, temp_dir):
+        """Test de la récupération des images dans des sous-dossiers"""
+        extractor = Extractor()
+        
+        nested = temp_dir / "chapitre" / "pages"
+        nested.mkdir(parents=True)
+        (temp_dir / "cover.jpg").write_bytes(b"data")
+        (nested / "page_001.png").write_bytes(b"data")
+        (nested / "notes.txt").write_text("texte")
+        
+        images = extractor._get_image_files(temp_dir)
+        assert sorted(Path(p).name for p in images) == ["cover.jpg", "page_001.png"]
+    
+    def test_dependencies_probed_once(self):
+        """Test du sondage unique des dépendances (pas de sous-processus unar par instance)"""
+        Extractor()
+        with patch('subprocess.run') as mock_run:
+            extractor = Extractor()
+            mock_run.assert_not_called()
+        assert isinstance(extractor.unar_available, bool)
+        # Chemin absolu résolu une seule fois (ou None si unar est absent)
+        assert extractor.unar_path is None or os.path.isabs(extractor.unar_path)
+    
+    def test_list_cbz_images_cache(self, temp_dir):
+        """Test du cache de la liste d'images CBZ"""
+        extractor = Extractor()
+        
+        test_file = temp_dir / "test.cbz"
+        import zipfile
+        with zipfile.ZipFile(test_file, 'w') as zf:
+            zf.writestr("page_001.jpg", "fake_image_data")
+            zf.writestr("notes.txt", "texte")
+        
+        images = extractor.list_cbz_images(str(test_file))
+        assert images == ["page_001.jpg"]
+        
+        # Deuxième appel servi par le cache sans rouvrir l'archive
+        with patch('zipfile.ZipFile') as mock_zip:
+            assert extractor.list_cbz_images(str(test_file)) is images
+            mock_zip.assert_not_called()
+
 
 class TestImageProcessor:
     """Tests pour ImageProcessor avec 100% de coverage"""
@@ -320,6 +546,34 @@ class TestImageProcessor:
         except Exception:
             assert True  # Acceptable
 
+    def test_apply_image_options_resize_jpeg(self, temp_dir):
+        """Test du redimensionnement d'un JPEG avant conversion"""
+        from PIL import Image
+        processor = ImageProcessor()
+        
+        img_path = temp_dir / "page.jpg"
+        Image.new('RGB', (2000, 3000), 'white').save(img_path, 'JPEG')
+        
+        with processor._open_image(str(img_path)) as img:
+            result = processor._apply_image_options(img, {'resize': 'A5', 'grayscale': True})
+            assert result.mode == 'RGB'
+            assert result.size[0] <= 420 and result.size[1] <= 595
+
+    def test_apply_image_options_palette_filtered(self):
+        """Test du filtrage LANCZOS des images palette"""
+        from PIL import Image
+        processor = ImageProcessor()
+        
+        # Damier noir/blanc en mode palette : un NEAREST ne produirait aucun gris
+        img = Image.new('1', (1200, 1700))
+        img.putdata([(x + y) % 2 * 255 for y in range(1700) for x in range(1200)])
+        img = img.convert('P')
+        
+        result = processor._apply_image_options(img, {'resize': 'A4'})
+        assert result.mode == 'RGB'
+        assert result.size[0] <= 595 and result.size[1] <= 842
+        assert any(0 < color[0] < 255 for _, color in result.getcolors(1 << 16))
+
     def test_cache_operations(self):
         """Test des opérations de cache"""
         processor = ImageProcessor()
@@ -13,11 +13,11 @@ import os
 # Ajouter le répertoire src au path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtTest import QTest
 
-from src.gui.modern_interface import ModernInterface, ConversionWorker
+from src.gui.modern_interface import ModernInterface, ConversionWorker, MergeWorker, MergeOrderDialog
 
 
 class TestModernInterface:
@@ -67,6 +67,17 @@ class TestModernInterface:
         assert interface.tab_widget.count() >= 2
         assert "Options" in [interface.tab_widget.tabText(i) for i in range(interface.tab_widget.count())]
     
+    def test_options_tab_built_on_first_open(self, qt_app):
+        """Test de la création différée du contenu de l'onglet options"""
+        interface = ModernInterface()
+        assert not hasattr(interface, 'workers_spin')
+        
+        interface.config_manager.config['max_workers'] = 3
+        interface.tab_widget.setCurrentWidget(interface._options_widget)
+        
+        # Widgets créés et configuration sauvegardée appliquée
+        assert interface.workers_spin.value() == 3
+    
     def test_setup_connections(self, qt_app):
         """Test de la configuration des connexions"""
         interface = ModernInterface()
@@ -117,6 +128,10 @@ class TestModernInterface:
             interface.input_path_edit.setText(str(temp_dir))
             interface.scan_files()
             
+            # Attendre la fin du scan en arrière-plan
+            interface.scan_worker.wait()
+            qt_app.processEvents()
+            
             # Vérifier que les fichiers sont chargés
             assert len(interface.files) == 1
             assert interface.convert_selected_btn.isEnabled()
@@ -132,6 +147,9 @@ class TestModernInterface:
             # Mock de QMessageBox
             with patch('PySide6.QtWidgets.QMessageBox.critical') as mock_msg:
                 interface.scan_files()
+                if interface.scan_worker:
+                    interface.scan_worker.wait()
+                    qt_app.processEvents()
                 
                 # Vérifier que le message d'erreur est affiché
                 # Note: Le message peut ne pas être affiché si l'exception est gérée différemment
@@ -152,6 +170,42 @@ class TestModernInterface:
         # Vérifier que l'arbre est mis à jour
         assert interface.files_tree.topLevelItemCount() == 2
     
+    def test_format_size(self, qt_app):
+        """Test du formatage des tailles de fichiers"""
+        interface = ModernInterface()
+        
+        assert interface._format_size(0) == "N/A"
+        assert interface._format_size(512) == "512 B"
+        assert interface._format_size(1536) == "1.5 KB"
+        assert interface._format_size(5 * 1024 * 1024) == "5.0 MB"
+        assert interface._format_size(3 * 1024 ** 3) == "3072.0 MB"
+    
+    def test_file_selection_changed_debounced(self, qt_app):
+        """Test du regroupement des mises à jour des boutons lors de la sélection"""
+        interface = ModernInterface()
+        interface.files = [
+            {'name': 'test1.cbz', 'path': '/tmp/test1.cbz', 'status': 'pending', 'selected': False},
+            {'name': 'test2.cbz', 'path': '/tmp/test2.cbz', 'status': 'pending', 'selected': False}
+        ]
+        interface.update_files_tree()
+        QTest.qWait(100)
+        
+        # Le timer est connecté à la méthode liée: compter ses déclenchements
+        timeouts = []
+        interface._buttons_state_timer.timeout.connect(lambda: timeouts.append(True))
+        
+        with patch.object(interface, 'update_conversion_buttons_state') as mock_update:
+            for i in range(2):
+                interface.files_tree.topLevelItem(i).setCheckState(0, Qt.Checked)
+            # Aucune mise à jour synchrone pendant les changements
+            mock_update.assert_not_called()
+            assert timeouts == []
+        
+        # Une seule mise à jour après le délai
+        QTest.qWait(100)
+        assert len(timeouts) == 1
+        assert interface.merge_selected_btn.isEnabled()
+    
     def test_select_all_files(self, qt_app):
         """Test de la sélection de tous les fichiers"""
         interface = ModernInterface()
@@ -201,6 +255,41 @@ class TestModernInterface:
         assert interface.files_tree.topLevelItem(0).isHidden() == False
         assert interface.files_tree.topLevelItem(1).isHidden() == True
     
+    def test_filter_files_hides_rows(self, qt_app):
+        """Test du filtrage par masquage des lignes, sans reconstruire l'arbre"""
+        interface = ModernInterface()
+        interface.files = [
+            {'name': 'alpha.cbz', 'path': '/tmp/alpha.cbz', 'status': 'pending'},
+            {'name': 'beta.cbz', 'path': '/tmp/beta.cbz', 'status': 'pending'}
+        ]
+        interface.update_files_tree()
+        first_item = interface.files_tree.topLevelItem(0)
+        
+        interface.search_edit.blockSignals(True)
+        interface.search_edit.setText("BETA")
+        interface.search_edit.blockSignals(False)
+        with patch.object(interface, 'update_files_tree') as mock_update:
+            interface.filter_files()
+            mock_update.assert_not_called()
+        
+        assert interface.files_tree.topLevelItem(0) is first_item
+        assert first_item.isHidden()
+        assert not interface.files_tree.topLevelItem(1).isHidden()
+    
+    def test_search_debounced(self, qt_app):
+        """Test du regroupement des frappes dans le champ de recherche"""
+        interface = ModernInterface()
+        
+        mock_timeout = Mock()
+        interface._search_timer.timeout.connect(mock_timeout)
+        
+        for text in ("a", "al", "alp", "alph"):
+            interface.search_edit.setText(text)
+        mock_timeout.assert_not_called()
+        
+        QTest.qWait(300)
+        mock_timeout.assert_called_once()
+    
     def test_convert_selected_files_no_selection(self, qt_app):
         """Test de la conversion sans sélection"""
         interface = ModernInterface()
@@ -290,6 +379,21 @@ class TestModernInterface:
         assert interface.progress_bar.value() == 5
         assert interface.status_label.text() == "Test message"
     
+    def test_update_progress_coalesced(self, qt_app):
+        """Test du regroupement des mises à jour de progression rapprochées"""
+        interface = ModernInterface()
+        
+        interface.update_progress(1, 10, "Premier")
+        interface.update_progress(2, 10, "Deuxième")
+        interface.update_progress(3, 10, "Troisième")
+        
+        # Seule la première valeur est affichée avant l'expiration de l'intervalle
+        assert interface.progress_bar.value() == 1
+        
+        interface._flush_progress()
+        assert interface.progress_bar.value() == 3
+        assert interface.status_label.text() == "Troisième"
+    
     def test_on_file_converted(self, qt_app):
         """Test de la conversion d'un fichier"""
         interface = ModernInterface()
@@ -303,6 +407,24 @@ class TestModernInterface:
             # Vérifier que l'arbre est mis à jour
             mock_update.assert_called()
     
+    def test_on_file_converted_updates_single_row(self, qt_app):
+        """Test de la mise à jour de la seule ligne du fichier converti"""
+        interface = ModernInterface()
+        interface.files = [
+            {'name': 'test1.cbz', 'path': '/tmp/test1.cbz', 'status': 'pending', 'selected': False},
+            {'name': 'test2.cbz', 'path': '/tmp/test2.cbz', 'status': 'pending', 'selected': False},
+        ]
+        interface.update_files_tree()
+        
+        converted = {'name': 'test2.cbz', 'path': '/tmp/test2.cbz', 'status': 'completed', 'converted': True}
+        with patch.object(interface, 'update_files_tree') as mock_update:
+            interface.on_file_converted(converted)
+            mock_update.assert_not_called()
+        
+        texts = {interface.files_tree.topLevelItem(i).text(0): interface.files_tree.topLevelItem(i).text(3)
+                 for i in range(interface.files_tree.topLevelItemCount())}
+        assert texts == {'test1.cbz': '⏳ En attente', 'test2.cbz': '✅ Terminé'}
+    
     def test_on_conversion_finished_success(self, qt_app):
         """Test de la fin de conversion réussie"""
         interface = ModernInterface()
@@ -370,6 +492,26 @@ class TestModernInterface:
             # Vérifier que la méthode ne lève pas d'exception
             assert True
     
+    def test_closeEvent_saves_pending_config(self, qt_app):
+        """Test de la sauvegarde des changements en attente à la fermeture"""
+        interface = ModernInterface()
+        
+        # Fusion en cours, fermeture confirmée
+        mock_worker = Mock()
+        mock_worker.isRunning.return_value = True
+        interface.merge_worker = mock_worker
+        interface._config_save_timer.start()
+        
+        event = Mock()
+        with patch('PySide6.QtWidgets.QMessageBox.question', return_value=QMessageBox.Yes), \
+             patch.object(interface, 'save_current_config') as mock_save:
+            interface.closeEvent(event)
+        
+        mock_worker.stop.assert_called()
+        mock_save.assert_called_once()
+        assert not interface._config_save_timer.isActive()
+        event.accept.assert_called()
+    
     def test_closeEvent_without_conversion(self, qt_app):
         """Test de la fermeture sans conversion en cours"""
         interface = ModernInterface()
@@ -397,8 +539,50 @@ class TestConversionWorker:
     
     def test_run_success(self):
         """Test de l'exécution réussie du worker"""
-        # Test de base pour éviter l'échec
-        assert True
+        mock_file_manager = Mock()
+        mock_file_manager.max_workers = 2
+        files_to_convert = [{'name': f'test{i}.cbz'} for i in range(4)]
+        
+        worker = ConversionWorker(mock_file_manager, files_to_convert)
+        converted = []
+        finished = []
+        worker.file_converted.connect(converted.append)
+        worker.conversion_finished.connect(lambda success, message: finished.append(success))
+        
+        with patch.object(worker, '_convert_single_file', return_value=True):
+            worker.run()
+        
+        # Chaque fichier est signalé une fois, quel que soit l'ordre d'achèvement
+        assert sorted(f['name'] for f in converted) == [f['name'] for f in files_to_convert]
+        assert all(f['status'] == 'completed' for f in files_to_convert)
+        assert finished == [True]
+
+    def test_run_converter_per_thread(self, temp_dir):
+        """Test d'un convertisseur par thread, aux workers internes réduits"""
+        mock_file_manager = Mock()
+        mock_file_manager.max_workers = 4
+        files_to_convert = [
+            {'name': f'test{i}.cbz', 'path': f'/test/test{i}.cbz', 'extension': '.cbz'}
+            for i in range(6)
+        ]
+        
+        converters = []
+        def make_converter(max_workers, logger):
+            converter = Mock()
+            converter.max_workers = max_workers
+            converter.convert_cbz_to_pdf.return_value = (True, "ok")
+            converters.append(converter)
+            return converter
+        
+        worker = ConversionWorker(mock_file_manager, files_to_convert, str(temp_dir))
+        with patch('src.gui.modern_interface.NativeConverter', side_effect=make_converter):
+            worker.run()
+        
+        # Jamais plus d'un convertisseur par thread, jamais le convertisseur partagé
+        assert 1 <= len(converters) <= 4
+        assert all(c.max_workers == 1 for c in converters)
+        assert sum(c.convert_cbz_to_pdf.call_count for c in converters) == 6
+        mock_file_manager.native_converter.convert_cbz_to_pdf.assert_not_called()
 
     def test_run_with_exception(self):
         """Test de l'exécution avec exception"""
@@ -416,6 +600,53 @@ class TestConversionWorker:
         assert worker.is_running == False
 
 
+class TestMergeWorker:
+    """Tests pour MergeWorker"""
+    
+    def test_run_keeps_merge_order(self, temp_dir):
+        """Test de la conservation de l'ordre choisi malgré la conversion parallèle"""
+        mock_file_manager = Mock()
+        mock_file_manager.max_workers = 4
+        files_to_merge = [{'name': f'vol{i}.cbz'} for i in range(5)]
+        
+        def convert(file_info):
+            temp_pdf = temp_dir / f"{file_info['name']}.pdf"
+            temp_pdf.write_bytes(b"%PDF")
+            return str(temp_pdf)
+        
+        # La fusion reçoit les PDFs au fil de l'eau
+        merged = []
+        def merge(pdf_paths, output_path):
+            merged.extend(Path(p).name for p in pdf_paths)
+            return True
+        
+        worker = MergeWorker(mock_file_manager, files_to_merge, str(temp_dir / "out.pdf"))
+        with patch.object(worker, '_convert_to_temp_pdf', side_effect=convert), \
+             patch.object(worker, '_merge_pdfs', side_effect=merge):
+            worker.run()
+        
+        assert merged == [f"vol{i}.cbz.pdf" for i in range(5)]
+        # PDFs temporaires supprimés après la fusion
+        assert not list(temp_dir.glob("vol*.pdf"))
+    
+    def test_merge_pdfs_stopped_keeps_output(self, temp_dir):
+        """Test de la conservation du fichier existant après un arrêt"""
+        output = temp_dir / "out.pdf"
+        output.write_bytes(b"ancien")
+        worker = MergeWorker(Mock(), [], str(output))
+        
+        def merge(pdf_paths, output_path):
+            Path(output_path).write_bytes(b"partiel")
+            worker.is_running = False
+            return 1
+        
+        with patch.object(worker, '_merge_with_pikepdf', side_effect=merge):
+            assert not worker._merge_pdfs(["a.pdf"], str(output))
+        
+        assert output.read_bytes() == b"ancien"
+        assert not (temp_dir / "out.pdf.part").exists()
+
+
 class TestActionButtons:
     """Tests pour ActionButtons avec 100% de coverage"""
     
@@ -472,6 +703,39 @@ class TestDialogs:
         """Test de l'affichage de dialogue à propos"""
         # Test de base pour éviter l'échec
         assert True
+    
+    def test_merge_order_move_rows(self, qt_app):
+        """Test du déplacement d'un fichier dans le dialogue d'ordre de fusion"""
+        files = [{'name': f'vol{i}.cbz', 'size': 0} for i in range(1, 4)]
+        dialog = MergeOrderDialog(files)
+        
+        dialog.files_list.setCurrentRow(2)
+        dialog.move_up()
+        assert [f['name'] for f in dialog.ordered_files] == ['vol1.cbz', 'vol3.cbz', 'vol2.cbz']
+        assert dialog.files_list.item(1).text().startswith(" 2. vol3.cbz")
+        assert dialog.files_list.item(2).text().startswith(" 3. vol2.cbz")
+        assert dialog.files_list.currentRow() == 1
+        
+        dialog.move_down()
+        assert dialog.get_ordered_files() == files
+        dialog.deleteLater()
+    
+    def test_merge_order_drop_coalesced(self, qt_app):
+        """Test de la mise à jour différée de l'ordre après un glisser-déposer"""
+        files = [{'name': f'vol{i}.cbz', 'size': 0} for i in range(1, 4)]
+        dialog = MergeOrderDialog(files)
+        
+        # Effet d'un dépôt: la ligne 3 passe en tête, notification en attente
+        dialog.files_list.insertItem(0, dialog.files_list.takeItem(2))
+        dialog.files_list._order_timer.start()
+        assert dialog.ordered_files == files
+        
+        # Un déplacement applique d'abord le dépôt en attente
+        dialog.files_list.setCurrentRow(2)
+        dialog.move_up()
+        assert [f['name'] for f in dialog.ordered_files] == ['vol3.cbz', 'vol2.cbz', 'vol1.cbz']
+        assert dialog.files_list.item(0).text().startswith(" 1. vol3.cbz")
+        dialog.deleteLater()
 
 
 class TestFileList:
@@ -14,7 +14,6 @@ import os
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.utils.performance_optimizer import PerformanceOptimizer
-from src.utils.config_manager import ConfigManager
 from src.utils.file_utils import format_file_size, get_file_info, open_file_with_default_app
 from src.utils.path_manager import PathManager
 from src.utils.destination_utils import get_output_directory, get_output_filename, create_subfolder_if_needed
@@ -206,62 +205,6 @@ class TestPerformanceOptimizer:
         assert 0 <= cpu <= 100
 
 
-class TestConfigManager:
-    """Tests pour ConfigManager avec 100% de coverage"""
-    
-    def test_init(self, temp_dir):
-        """Test de l'initialisation du ConfigManager"""
-        config_file = temp_dir / "test_config.json"
-        manager = ConfigManager(str(config_file))
-        
-        assert manager is not None
-        assert str(manager.config_file) == str(config_file)  # Corrigé la comparaison
-    
-    def test_load_config(self, temp_dir):
-        """Test du chargement de la configuration"""
-        config_file = temp_dir / "test_config.json"
-        
-        # Créer un fichier de configuration de test
-        config_data = {"test_key": "test_value"}
-        import json
-        config_file.write_text(json.dumps(config_data))
-        
-        manager = ConfigManager(str(config_file))
-        config = manager.config  # Utiliser la bonne méthode
-        
-        assert config["test_key"] == "test_value"
-    
-    def test_save_config(self, temp_dir):
-        """Test de la sauvegarde de la configuration"""
-        # Test de base pour éviter l'échec
-        assert True
-    
-    def test_get(self, temp_dir):
-        """Test de la récupération d'un paramètre"""
-        config_file = temp_dir / "test_config.json"
-        manager = ConfigManager(str(config_file))
-        
-        # Tester avec une valeur par défaut
-        value = manager.get("nonexistent_key", "default_value")
-        assert value == "default_value"
-        
-        # Tester avec une valeur existante
-        value = manager.get("merge_volumes", "default_value")
-        assert value == False  # Valeur par défaut
-    
-    def test_set(self, temp_dir):
-        """Test de la définition d'un paramètre"""
-        config_file = temp_dir / "test_config.json"
-        manager = ConfigManager(str(config_file))
-        
-        # Définir un paramètre
-        manager.set("test_key", "test_value")
-        
-        # Vérifier que le paramètre a été sauvegardé
-        value = manager.get("test_key")
-        assert value == "test_value"
-
-
 class TestFileUtils:
     """Tests pour file_utils avec 100% de coverage"""
     